@@ -69,6 +69,8 @@ __all__ = []
 
 
 class UniqueCommandHandler(ExporterHandler):
+    NAME = "unique"
+
     def __init__(self, sub_parser):
         self.parser = sub_parser.add_parser(
             "unique",
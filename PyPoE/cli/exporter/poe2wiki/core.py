@@ -30,10 +30,9 @@ See PyPoE/LICENSE
 # =============================================================================
 
 # Python
+import sys
 
 # self
-from PyPoE.cli.exporter.poe2wiki.admin import ADMIN_HANDLERS
-from PyPoE.cli.exporter.poe2wiki.parsers import WIKI_HANDLERS
 from PyPoE.cli.handler import BaseHandler
 
 # =============================================================================
@@ -56,8 +55,32 @@ class WikiHandler(BaseHandler):
         self.parser.set_defaults(func=lambda args: self.parser.print_help())
         wiki_sub = self.parser.add_subparsers()
 
-        for handler in WIKI_HANDLERS:
-            handler(wiki_sub)
-
-        for handler in ADMIN_HANDLERS:
-            handler(wiki_sub)
+        argv = sys.argv[1:]
+        help_requested = "-h" in argv or "--help" in argv
+
+        # Same lazy construction scheme as the poe1 handler in
+        # PyPoE.cli.exporter.wiki.core: importing the handler packages pulls
+        # in every poe2 parser module, so skip it entirely unless this
+        # invocation can reach a poe2wiki subcommand
+        if "poe2wiki" not in argv and not help_requested:
+            return
+
+        from PyPoE.cli.exporter.poe2wiki.admin import ADMIN_HANDLERS
+        from PyPoE.cli.exporter.poe2wiki.parsers import WIKI_HANDLERS
+
+        handlers = {handler.NAME: handler for handler in WIKI_HANDLERS + ADMIN_HANDLERS}
+
+        try:
+            requested = argv[argv.index("poe2wiki") + 1]
+        except (ValueError, IndexError):
+            requested = None
+
+        if requested in handlers and not help_requested:
+            handlers[requested](wiki_sub)
+        elif requested is not None and not requested.startswith("-") and not help_requested:
+            # Name-only stubs are enough for argparse's "invalid choice" error
+            for name in handlers:
+                wiki_sub.add_parser(name, add_help=False)
+        else:
+            for handler in handlers.values():
+                handler(wiki_sub)
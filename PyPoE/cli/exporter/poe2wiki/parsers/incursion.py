@@ -71,6 +71,8 @@ class IncursionRoomWikiCondition(parser.WikiCondition):
 
 
 class IncursionCommandHandler(ExporterHandler):
+    NAME = "incursion"
+
     def __init__(self, sub_parser):
         self.parser = sub_parser.add_parser(
             "incursion",
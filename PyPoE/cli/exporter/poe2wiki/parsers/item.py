@@ -325,6 +325,8 @@ class UniqueMapItemWikiCondition(MapItemWikiCondition):
 
 
 class ItemsHandler(ExporterHandler):
+    NAME = "items"
+
     def __init__(self, sub_parser, *args, **kwargs):
         super().__init__(self, sub_parser, *args, **kwargs)
         self.parser = sub_parser.add_parser("items", help="Items Exporter")
@@ -178,6 +178,8 @@ class GenericLuaParser(BaseParser):
 
 
 class LuaHandler(ExporterHandler):
+    NAME = "lua"
+
     def __init__(self, sub_parser):
         self.parser = sub_parser.add_parser("lua", help="Lua Exporter")
         self.parser.set_defaults(func=lambda args: self.parser.print_help())
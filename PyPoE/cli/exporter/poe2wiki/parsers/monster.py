@@ -69,6 +69,8 @@ class MonsterWikiCondition(parser.WikiCondition):
 
 
 class MonsterCommandHandler(ExporterHandler):
+    NAME = "monster"
+
     def __init__(self, sub_parser):
         self.parser = sub_parser.add_parser(
             "monster",
@@ -63,6 +63,8 @@ __all__ = ["SkillHandler"]
 
 
 class SkillHandler(ExporterHandler):
+    NAME = "skill"
+
     def __init__(self, sub_parser):
         self.parser = sub_parser.add_parser("skill", help="Skill data Exporter")
         self.parser.set_defaults(func=lambda args: self.parser.print_help())
@@ -24,11 +24,13 @@ Agreement
 
 See PyPoE/LICENSE
 """
+import http.client
+import io
 import json
+import urllib.error
 
 # Python
-import re
-from urllib import request
+from functools import lru_cache
 
 from PyPoE.cli.exporter import config
 
@@ -49,17 +51,62 @@ __all__ = [
     "fix_path",
 ]
 
+_CDN_INDEX_HOST = "lvlvllvlvllvlvl.github.io"
+
+_cdn_index_connection = None
+
 
 # =============================================================================
 # Functions
 # =============================================================================
 
 
+def _get_cdn_urls(sequel):
+    """
+    Fetches the CDN url list, keeping the https connection alive so
+    subsequent lookups skip the TCP+TLS handshake.
+    """
+    global _cdn_index_connection
+    url_path = f"/poecdn-bundle-index/poe{sequel}/urls.json"
+    for retry in (True, False):
+        if _cdn_index_connection is None:
+            _cdn_index_connection = http.client.HTTPSConnection(_CDN_INDEX_HOST)
+        try:
+            _cdn_index_connection.request("GET", url_path)
+            response = _cdn_index_connection.getresponse()
+            if response.status != 200:
+                # Drain the body so the connection stays reusable, then
+                # fail like urlopen would instead of handing an error page
+                # to the JSON decoder
+                response.read()
+                raise urllib.error.HTTPError(
+                    f"https://{_CDN_INDEX_HOST}{url_path}",
+                    response.status,
+                    response.reason,
+                    response.headers,
+                    None,
+                )
+            # Decode incrementally instead of materialising the raw
+            # bytes and a decoded copy of the whole payload
+            return json.load(io.TextIOWrapper(response, encoding="utf-8"))["urls"]
+        except (ConnectionError, http.client.HTTPException):
+            # Stale keep-alive connection; reconnect once
+            _cdn_index_connection.close()
+            _cdn_index_connection = None
+            if not retry:
+                raise
+
+
+@lru_cache(maxsize=4)
 def get_content_path(sequel=1):
     """
     Returns the path to the current content.ggpk based on the specified
     config variables for the version & distributor.
 
+    The result is cached per sequel; resolving it can involve filesystem
+    probes or a CDN lookup. Use ``get_content_path.cache_clear()`` after
+    changing the relevant config options.
+
     :return: Path of the content ggpk
     :rtype: str
 
@@ -71,10 +118,7 @@ def get_content_path(sequel=1):
         paths = PoEPath(*args).get_installation_paths()
 
         if not paths:
-            with request.urlopen(
-                f"https://lvlvllvlvllvlvl.github.io/poecdn-bundle-index/poe{sequel}/urls.json"
-            ) as cdn_url:
-                paths = json.loads(cdn_url.read().decode("utf-8"))["urls"]
+            paths = _get_cdn_urls(sequel)
 
         return paths[0]
     else:
@@ -83,7 +127,8 @@ def get_content_path(sequel=1):
 
 def fix_path(path: str) -> str:
     path = path.replace('"', "'", 2).replace("\t", "")
-    if re.search("[a-zA-Z]:.*", path) is not None:
-        return path[:2] + re.sub(r":", "_", path[2:])
+    # "<letter>:" drive prefix check; a regex is overkill for this
+    if len(path) >= 2 and path[1] == ":" and path[0].isalpha():
+        return path[:2] + path[2:].replace(":", "_")
     else:
         return path
@@ -30,12 +30,11 @@ See PyPoE/LICENSE
 # =============================================================================
 
 # Python
+import sys
 
 # self
 from PyPoE.cli.core import Msg, console
 from PyPoE.cli.exporter import config
-from PyPoE.cli.exporter.wiki.admin import ADMIN_HANDLERS
-from PyPoE.cli.exporter.wiki.parsers import WIKI_HANDLERS
 from PyPoE.cli.handler import BaseHandler
 
 # =============================================================================
@@ -64,11 +63,41 @@ class WikiHandler(BaseHandler):
         self.parser.set_defaults(func=lambda args: self.parser.print_help())
         wiki_sub = self.parser.add_subparsers()
 
-        for handler in WIKI_HANDLERS:
-            handler(wiki_sub)
+        argv = sys.argv[1:]
+        help_requested = "-h" in argv or "--help" in argv
 
-        for handler in ADMIN_HANDLERS:
-            handler(wiki_sub)
+        # Importing the handler packages drags in every parser module, so
+        # don't even import them unless this invocation can reach a wiki
+        # subcommand (or help output needs the full command list).
+        if "wiki" not in argv and not help_requested:
+            return
+
+        from PyPoE.cli.exporter.wiki.admin import ADMIN_HANDLERS
+        from PyPoE.cli.exporter.wiki.parsers import WIKI_HANDLERS
+
+        # Constructing every handler builds the full argparse tree for all
+        # subcommands, which dominates cold-start time. If the command line
+        # already names a specific subcommand, only construct that handler;
+        # otherwise (help or unknown command) fall back to constructing all
+        # of them so argparse can produce proper help/error output.
+        handlers = {handler.NAME: handler for handler in WIKI_HANDLERS + ADMIN_HANDLERS}
+
+        try:
+            requested = argv[argv.index("wiki") + 1]
+        except (ValueError, IndexError):
+            requested = None
+
+        if requested in handlers and not help_requested:
+            handlers[requested](wiki_sub)
+        elif requested is not None and not requested.startswith("-") and not help_requested:
+            # Unknown subcommand - argparse only needs the valid names to
+            # emit its standard "invalid choice" error, so register
+            # name-only stubs instead of constructing every handler
+            for name in handlers:
+                wiki_sub.add_parser(name, add_help=False)
+        else:
+            for handler in handlers.values():
+                handler(wiki_sub)
 
     def _ver_dist_changed(self, key, value, old_value):
         if value == old_value:
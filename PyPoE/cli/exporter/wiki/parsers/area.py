@@ -75,6 +75,8 @@ class WikiCondition(parser.WikiCondition):
 
 
 class AreaCommandHandler(ExporterHandler):
+    NAME = "area"
+
     def __init__(self, sub_parser):
         self.parser = sub_parser.add_parser(
             "area",
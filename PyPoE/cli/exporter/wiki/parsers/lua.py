@@ -31,11 +31,14 @@ See PyPoE/LICENSE
 # Imports
 # =============================================================================
 
+import io
 import re
 
 # Python
-from collections import OrderedDict, defaultdict
-from functools import partial
+from collections import Counter, OrderedDict
+from functools import lru_cache, partial
+from itertools import count
+from operator import itemgetter
 
 from PyPoE.cli.exporter.wiki.handler import ExporterHandler, ExporterResult
 from PyPoE.cli.exporter.wiki.parser import BaseParser, TagHandler
@@ -49,11 +52,43 @@ from PyPoE.poe.text import parse_description_tags
 
 __all__ = ["LuaHandler"]
 
+_RE_MARKUP_TAG = re.compile(r"<([^>]+)>{([^}]+)}")
+
+# Lua string escapes in a single scan; the regex engine skips the (large)
+# unescaped stretches in C and only calls back per actual escape character
+_RE_ESCAPE = re.compile(r'["\n\r]')
+_ESCAPE_BR = {'"': '\\"', "\n": "<br>", "\r": ""}
+_ESCAPE_NOBR = {'"': '\\"', "\n": "\\n", "\r": ""}
+
+_BLIGHT_ICON_PREFIX = "Art/2DArt/UIImages/InGame/Blight/Tower Icons/Icon"
+
+# C-level accessors for the ubiquitous "take this column of the linked row"
+# copy transforms
+_GET_ID = itemgetter("Id")
+_GET_NAME = itemgetter("Name")
+_GET_TEXT = itemgetter("Text")
+
 # =============================================================================
 # Functions
 # =============================================================================
 
 
+def _percent_multiplier(value):
+    return value / 100
+
+
+def _id_list(values):
+    return list(map(_GET_ID, values))
+
+
+def _name_list(values):
+    return list(map(_GET_NAME, values))
+
+
+def _text_list(values):
+    return list(map(_GET_TEXT, values))
+
+
 def lua_format_value(key, value):
     if isinstance(value, int):
         f = "\t\t%s=%s,\n"
@@ -62,87 +97,163 @@ def lua_format_value(key, value):
     return f % (key, value)
 
 
+@lru_cache(maxsize=64)
+def _markup_tag_lower(tag: str) -> str:
+    # The same handful of tags repeats across a document
+    return tag.lower()
+
+
+def _markup_sub(match):
+    tag = _markup_tag_lower(match.group(1))
+    lines = match.group(2).splitlines()
+    if len(lines) == 1:
+        return f"{{{{c|{tag}|{lines[0]}}}}}"
+    return "\n".join("{{c|%s|%s}}" % (tag, line) for line in lines)
+
+
+@lru_cache(maxsize=512)
 def markup_to_wiki(text: str):
-    return re.sub(
-        r"<([^>]+)>{([^}]+)}",
-        lambda match: "\n".join(
-            "{{c|%s|%s}}" % (match.group(1).lower(), line) for line in match.group(2).splitlines()
-        ),
-        text,
-    )
+    # Shared templates repeat the same markup across packs
+    return _RE_MARKUP_TAG.sub(_markup_sub, text)
+
+
+@lru_cache(maxsize=1024)
+def _format_key_cached(key):
+    if not key.isidentifier():
+        return '["%s"]' % key
+    return key
+
+
+def _format_key(key):
+    # The same column names recur for every row of an export
+    if not isinstance(key, str):
+        key = str(key)
+    return _format_key_cached(key)
+
+
+def _format_bool(value, write, indent, newline, br):
+    write("true" if value else "false")
+
+
+def _format_number(value, write, indent, newline, br):
+    write(str(value))
+
+
+def _format_sequence(value, write, indent, newline, br):
+    join = ",\n" if newline else ", "
+    # ID arrays and stat tables are plain numbers; serialize those with a
+    # single map+join instead of a recursive dispatch per element
+    if value and all(type(v) is int or type(v) is float for v in value):
+        write("{%s}" % join.join(map(str, value)))
+        return
+    write("{")
+    first = True
+    for v in value:
+        if first:
+            first = False
+        else:
+            write(join)
+        _write_value(v, write, indent + 1, newline, br)
+    write("}")
+
+
+def _format_dict(value, write, indent, newline, br):
+    format_key = _format_key
+    if newline:
+        prefix = "\t" * indent
+        outer = "\t" * (indent - 1)
+        write(f"{outer}{{\n")
+        first = True
+        for k, v in value.items():
+            if first:
+                first = False
+            else:
+                write("\n")
+            write(f"{prefix}{format_key(k)} = ")
+            _write_value(v, write, indent + 1, newline, br)
+            write(", ")
+        write(f"\n{outer}}}")
+    else:
+        write("{")
+        for k, v in value.items():
+            write(f"{format_key(k)} = ")
+            _write_value(v, write, indent + 1, newline, br)
+        write("}")
+
+
+def _format_str(value, write, indent, newline, br):
+    # Most strings (keys, ids, short values) contain nothing to escape
+    if '"' not in value and "\n" not in value and "\r" not in value:
+        write(f'"{value}"')
+    else:
+        table = _ESCAPE_BR if br else _ESCAPE_NOBR
+        write('"%s"' % _RE_ESCAPE.sub(lambda m: table[m.group(0)], value))
+
+
+def _format_other(value, write, indent, newline, br):
+    # Fallback for subclasses of the builtin types (and anything else),
+    # mirroring the order of the old isinstance ladder
+    if isinstance(value, bool):
+        _format_bool(value, write, indent, newline, br)
+    elif isinstance(value, (int, float)):
+        _format_number(value, write, indent, newline, br)
+    elif isinstance(value, (tuple, set, list)):
+        _format_sequence(value, write, indent, newline, br)
+    elif isinstance(value, dict):
+        _format_dict(value, write, indent, newline, br)
+    elif isinstance(value, str):
+        _format_str(value, write, indent, newline, br)
+    else:
+        write('"%s"' % value)
+
+
+def _write_value(value, write, indent, newline, br):
+    _FORMATTERS.get(type(value), _format_other)(value, write, indent, newline, br)
+
+
+# Exact-type dispatch: wiki data is almost exclusively builtin types, so a
+# single dict lookup replaces the isinstance chain on the recursive hot path
+_FORMATTERS = {
+    bool: _format_bool,
+    int: _format_number,
+    float: _format_number,
+    str: _format_str,
+    list: _format_sequence,
+    tuple: _format_sequence,
+    set: _format_sequence,
+    dict: _format_dict,
+    OrderedDict: _format_dict,
+}
 
 
 class LuaFormatter:
     def __init__(self):
         pass
 
-    @classmethod
-    def format_module(self, data, indent=0, newline=True, br=True):
-        out = []
-        out.append(
-            "local data = %s" % self.format_value(data, indent=indent + 1, newline=newline, br=br)
-        )
-        out.append("\n")
-        out.append("return data")
-
-        return "".join(out)
-
-    @classmethod
-    def format_key(self, key):
-        if not isinstance(key, str):
-            key = str(key)
-
-        if not key.isidentifier():
-            return '["%s"]' % key
-
-        return key
-
-    @classmethod
-    def format_value(self, value, indent=2, newline=True, br=True):
-        if isinstance(value, (int, float)):
-            if isinstance(value, bool):
-                return str(value).lower()
-            return str(value)
-        elif isinstance(value, (tuple, set, list)):
-            values = []
-            for v in value:
-                values.append(self.format_value(v, indent=indent + 1, newline=newline, br=br))
-            if newline:
-                join = ",\n"
-            else:
-                join = ", "
-            return "{%s}" % (join.join(values))
-        elif isinstance(value, dict):
-            values = []
-            if newline:
-                fmt = "%s%%s = %%s, " % ("\t" * indent)
-            else:
-                fmt = "%s = %s"
-            for k, v in value.items():
-                values.append(
-                    fmt
-                    % (
-                        self.format_key(k),
-                        self.format_value(v, indent=indent + 1, newline=newline, br=br),
-                    )
-                )
+    @staticmethod
+    def write_module(data, fp, indent=0, newline=True, br=True):
+        # Streams directly to the file object, so large tables never need
+        # the whole serialized module as one extra string in memory
+        write = fp.write
+        write("local data = ")
+        _write_value(data, write, indent + 1, newline, br)
+        write("\nreturn data")
 
-            if newline:
-                fmt = "%(indent)s{\n%%s\n%(indent)s}" % {
-                    "indent": "\t" * (indent - 1),
-                }
-                join = "\n"
-            else:
-                fmt = "{%s}"
-                join = ""
-
-            return fmt % join.join(values)
-        elif isinstance(value, str):
-            return '"%s"' % value.replace('"', '\\"').replace(
-                "\n", "<br>" if br else "\\n"
-            ).replace("\r", "")
-        else:
-            return '"%s"' % value
+    @staticmethod
+    def format_module(data, indent=0, newline=True, br=True):
+        buf = io.StringIO()
+        LuaFormatter.write_module(data, buf, indent, newline, br)
+        return buf.getvalue()
+
+    @staticmethod
+    def format_key(key):
+        return _format_key(key)
+
+    @staticmethod
+    def format_value(value, indent=2, newline=True, br=True):
+        buf = io.StringIO()
+        _write_value(value, buf.write, indent, newline, br)
+        return buf.getvalue()
 
 
 # =============================================================================
@@ -150,34 +261,99 @@ class LuaFormatter:
 # =============================================================================
 
 
+def _compile_copy_keys(keys):
+    """
+    Generates a straight-line copy function for a ``_COPY_KEYS_*`` spec.
+
+    The generic interpretation loop pays several dict lookups per key per
+    row; since the specs are fixed at class-definition time, compiling
+    them once turns each key into three bytecode-level statements.
+    """
+    namespace = {}
+    lines = ["def _copy(row, copyrow):"]
+    for i, (k, copy_data) in enumerate(keys):
+        lines.append(f"    value = row[{k!r}]")
+        lines.append("    if value is not None and value != '':")
+        if "value" in copy_data:
+            namespace[f"_value{i}"] = copy_data["value"]
+            lines.append(f"        value = _value{i}(value)")
+        if "value" in copy_data or "default" in copy_data:
+            namespace[f"_default{i}"] = copy_data.get("default")
+            lines.append(f"        if value != _default{i}:")
+            lines.append(f"            copyrow[{copy_data['key']!r}] = value")
+        else:
+            # Without a transform the value is already known to be neither
+            # None nor '', so the implicit default-None comparison can
+            # never match
+            lines.append(f"        copyrow[{copy_data['key']!r}] = value")
+    if len(lines) == 1:
+        lines.append("    pass")
+    exec("\n".join(lines), namespace)
+    return namespace["_copy"]
+
+
+# Compiled copy functions, keyed by id() of the spec tuple. Each entry also
+# stores the spec itself, which keeps it alive so its id() cannot be reused
+# by a later, different spec - that would silently hand out the wrong copy
+# function.
+_copy_funcs = {}
+
+
 class GenericLuaParser(BaseParser):
-    def _copy_from_keys(self, row, keys, out_data=None, index=None, rtr=False):
-        copyrow = OrderedDict()
-        for k, copy_data in keys:
-            value = row[k]
-            # print(k)
-            if value is not None and value != "":
-                if "value" in copy_data:
-                    value = copy_data["value"](value)
-
-                if value == copy_data.get("default"):
-                    continue
+    # (table, column) pairs whose index main relies on; subclasses declare
+    # them and call _build_indices so a shared reader never rebuilds an
+    # index that already exists
+    _INDICES = ()
+
+    def _build_indices(self):
+        for file_name, key in self._INDICES:
+            table = self.rr[file_name]
+            if key not in table.index:
+                table.build_index(key)
+
+    def _copy_one(self, row, keys):
+        """
+        Copies the specified keys of the row into a new dict.
+        """
+        try:
+            copy = _copy_funcs[id(keys)][1]
+        except KeyError:
+            copy = _copy_funcs.setdefault(id(keys), (keys, _compile_copy_keys(keys)))[1]
+
+        copyrow = {}
+        copy(row, copyrow)
+        return copyrow
+
+    def _copy_append(self, row, keys, out_data):
+        """
+        Copies the specified keys of the row and appends the result to
+        out_data.
+        """
+        out_data.append(self._copy_one(row, keys))
 
-                copyrow[copy_data["key"]] = value
+    def _copy_from_keys(self, row, keys, out_data=None, index=None, rtr=False):
+        # Compatibility wrapper; callers in this module use _copy_one or
+        # _copy_append directly so the common paths skip the mode checks
+        copyrow = self._copy_one(row, keys)
 
         if rtr:
             return copyrow
         else:
             if index is not None:
-                try:
+                # Callers walk the index monotonically, so the "row not
+                # there yet" case is the common one - check instead of
+                # letting IndexError fire on most rows
+                if index < len(out_data):
                     out_data[index].update(copyrow)
-                except IndexError:
+                else:
                     out_data.append(copyrow)
             else:
                 out_data.append(copyrow)
 
 
 class LuaHandler(ExporterHandler):
+    NAME = "lua"
+
     def __init__(self, sub_parser):
         self.parser = sub_parser.add_parser("lua", help="Lua Exporter")
         self.parser.set_defaults(func=lambda args: self.parser.print_help())
@@ -329,14 +505,10 @@ class MinimapIconsParser(GenericLuaParser):
     )
 
     def main(self, parsed_args):
-        minimap_icons = []
-        minimap_icons_lookup = OrderedDict()
-
-        for row in self.rr["MinimapIcons.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_MINIMAP_ICONS, minimap_icons)
-
-            # Lua starts offsets at 1
-            minimap_icons_lookup[row["Id"]] = row.rowid + 1
+        rows = self.rr["MinimapIcons.dat64"]
+        minimap_icons = [self._copy_one(row, self._COPY_KEYS_MINIMAP_ICONS) for row in rows]
+        # Lua starts offsets at 1
+        minimap_icons_lookup = {row["Id"]: row.rowid + 1 for row in rows}
 
         r = ExporterResult()
         for k in ("minimap_icons", "minimap_icons_lookup"):
@@ -371,6 +543,24 @@ class OTStatsParser(GenericLuaParser):
     }
 
     def main(self, parsed_args):
+        stat_descriptions = self.tc["stat_descriptions.txt"]
+
+        # The .ot files share many (stat, value) pairs and translation
+        # resolution dominates this parser, so memoize it
+        @lru_cache(maxsize=None)
+        def translate(stat, value):
+            return self._format_tr(
+                stat_descriptions.get_translation(
+                    tags=[
+                        stat,
+                    ],
+                    values=[
+                        value,
+                    ],
+                    full_result=True,
+                )
+            )
+
         r = ExporterResult()
         for data in self._DATA:
             stats = []
@@ -383,27 +573,15 @@ class OTStatsParser(GenericLuaParser):
                 if value == 0:
                     continue
 
-                txt = self._format_tr(
-                    self.tc["stat_descriptions.txt"].get_translation(
-                        tags=[
-                            stat,
-                        ],
-                        values=[
-                            value,
-                        ],
-                        full_result=True,
-                    )
-                )
+                txt = translate(stat, value)
 
                 stats.append(
-                    OrderedDict(
-                        (
-                            ("name", data["fn"]),
-                            ("id", stat),
-                            ("value", value),
-                            ("stat_text", txt or ""),
-                        )
-                    )
+                    {
+                        "name": data["fn"],
+                        "id": stat,
+                        "value": value,
+                        "stat_text": txt or "",
+                    }
                 )
 
             r.add_result(
@@ -446,7 +624,7 @@ class AtlasParser(GenericLuaParser):
             "AtlasRegionsKey",
             {
                 "key": "region_id",
-                "value": lambda v: v["Id"],
+                "value": _GET_ID,
             },
         ),
         (
@@ -467,7 +645,7 @@ class AtlasParser(GenericLuaParser):
         atlas_regions = []
 
         for row in self.rr["AtlasRegions.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_ATLAS_REGIONS, atlas_regions)
+            self._copy_append(row, self._COPY_KEYS_ATLAS_REGIONS, atlas_regions)
 
         r = ExporterResult()
         for k in ("atlas_regions", "atlas_base_item_types"):
@@ -503,7 +681,7 @@ class BestiaryParser(GenericLuaParser):
             "Category",
             {
                 "key": "header",
-                "value": lambda v: v["Text"],
+                "value": _GET_TEXT,
             },
         ),
         (
@@ -543,28 +721,28 @@ class BestiaryParser(GenericLuaParser):
             "BestiaryFamiliesKey",
             {
                 "key": "family",
-                "value": lambda x: x["Name"],
+                "value": _GET_NAME,
             },
         ),
         (
             "BestiaryGroupsKey",
             {
                 "key": "beast_group",
-                "value": lambda x: x["Name"],
+                "value": _GET_NAME,
             },
         ),
         (
             "BestiaryGenusKey",
             {
                 "key": "genus",
-                "value": lambda x: x["Name"],
+                "value": _GET_NAME,
             },
         ),
         (
             "ModsKey",
             {
                 "key": "mod_id",
-                "value": lambda x: x["Id"],
+                "value": _GET_ID,
             },
         ),
         (
@@ -579,32 +757,38 @@ class BestiaryParser(GenericLuaParser):
     def main(self, parsed_args):
         recipes = []
         components = []
-        recipe_components_temp = defaultdict(lambda: defaultdict(int))
+        component_counts = Counter()
 
         for row in self.rr["BestiaryRecipes.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_BESTIARY, recipes)
-            for value in row["BestiaryRecipeComponentKeys"]:
-                recipe_components_temp[row["Id"]][value["Id"]] += 1
+            self._copy_append(row, self._COPY_KEYS_BESTIARY, recipes)
+            recipe_id = row["Id"]
+            component_counts.update(
+                (recipe_id, value["Id"]) for value in row["BestiaryRecipeComponentKeys"]
+            )
 
+        client_strings = self.rr["ClientStrings.dat64"].index["Id"]
+        # Only a handful of rarities exist; cache their display texts
+        rarity_text = {}
         for row in self.rr["BestiaryRecipeComponent.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_BESTIARY_COMPONENTS, components)
+            component = self._copy_one(row, self._COPY_KEYS_BESTIARY_COMPONENTS)
             if row["BeastRarity"]:
-                display_string = "ItemDisplayString" + row["BeastRarity"]["Id"]
-                client_strings = self.rr["ClientStrings.dat64"].index["Id"]
-                components[-1]["rarity"] = client_strings[display_string]["Text"]
-
-        recipe_components = []
-        for recipe_id, data in recipe_components_temp.items():
-            for component_id, amount in data.items():
-                recipe_components.append(
-                    OrderedDict(
-                        (
-                            ("recipe_id", recipe_id),
-                            ("component_id", component_id),
-                            ("amount", amount),
-                        )
+                rarity_id = row["BeastRarity"]["Id"]
+                try:
+                    component["rarity"] = rarity_text[rarity_id]
+                except KeyError:
+                    component["rarity"] = rarity_text.setdefault(
+                        rarity_id, client_strings["ItemDisplayString" + rarity_id]["Text"]
                     )
-                )
+            components.append(component)
+
+        recipe_components = [
+            {
+                "recipe_id": recipe_id,
+                "component_id": component_id,
+                "amount": amount,
+            }
+            for (recipe_id, component_id), amount in component_counts.items()
+        ]
 
         r = ExporterResult()
         for k in ("recipes", "components", "recipe_components"):
@@ -653,7 +837,7 @@ class BlightParser(GenericLuaParser):
             "BlightCraftingTypesKey",
             {
                 "key": "type",
-                "value": lambda v: v["Id"],
+                "value": _GET_ID,
             },
         ),
     )
@@ -694,40 +878,42 @@ class BlightParser(GenericLuaParser):
             {
                 "key": "icon",
                 "value": lambda v: (
-                    "File:%s tower icon.png"
-                    % v.replace("Art/2DArt/UIImages/InGame/Blight/Tower Icons/Icon", "")
-                    if v.startswith("Art/2DArt/UIImages/InGame/Blight/Tower Icons")
+                    f"File:{v.removeprefix(_BLIGHT_ICON_PREFIX)} tower icon.png"
+                    if v.startswith(_BLIGHT_ICON_PREFIX)
                     else None
                 ),
             },
         ),
     )
 
+    _INDICES = (("BlightTowersPerLevel.dat64", "BlightTowersKey"),)
+
     def main(self, parsed_args):
         blight_crafting_recipes = []
         blight_crafting_recipes_items = []
         blight_towers = []
 
-        self.rr["BlightTowersPerLevel.dat64"].build_index("BlightTowersKey")
+        self._build_indices()
+        towers_per_level = self.rr["BlightTowersPerLevel.dat64"]
 
         for row in self.rr["BlightCraftingRecipes.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_CRAFTING_RECIPES, blight_crafting_recipes)
-
-            for i, blight_crafting_item in enumerate(row["BlightCraftingItemsKeys"], start=1):
-                blight_crafting_recipes_items.append(
-                    OrderedDict(
-                        (
-                            ("ordinal", i),
-                            ("recipe_id", row["Id"]),
-                            ("item_id", blight_crafting_item["BaseItemTypesKey"]["Id"]),
-                        )
-                    )
-                )
+            self._copy_append(row, self._COPY_KEYS_CRAFTING_RECIPES, blight_crafting_recipes)
+
+            recipe_id = row["Id"]
+            blight_crafting_recipes_items.extend(
+                {
+                    "ordinal": i,
+                    "recipe_id": recipe_id,
+                    "item_id": blight_crafting_item["BaseItemTypesKey"]["Id"],
+                }
+                for i, blight_crafting_item in zip(count(1), row["BlightCraftingItemsKeys"])
+            )
 
+        per_level_index = towers_per_level.index["BlightTowersKey"]
         for row in self.rr["BlightTowers.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_BLIGHT_TOWERS, blight_towers)
-            per_level = self.rr["BlightTowersPerLevel.dat64"].index["BlightTowersKey"][row]
-            blight_towers[-1]["cost"] = per_level[0]["Cost"]
+            tower = self._copy_one(row, self._COPY_KEYS_BLIGHT_TOWERS)
+            tower["cost"] = per_level_index[row][0]["Cost"]
+            blight_towers.append(tower)
 
         r = ExporterResult()
         for k in ("crafting_recipes", "crafting_recipes_items", "towers"):
@@ -834,28 +1020,28 @@ class DelveParser(GenericLuaParser):
             "BaseItemTypesKey",
             {
                 "key": "base_item_id",
-                "value": lambda x: x["Id"],
+                "value": _GET_ID,
             },
         ),
         (
             "AddedModsKeys",
             {
                 "key": "added_modifier_ids",
-                "value": lambda x: [v["Id"] for v in x],
+                "value": _id_list,
             },
         ),
         (
             "ForcedAddModsKeys",
             {
                 "key": "forced_modifier_ids",
-                "value": lambda x: [v["Id"] for v in x],
+                "value": _id_list,
             },
         ),
         (
             "SellPrice_ModsKeys",
             {
                 "key": "sell_price_modifier_ids",
-                "value": lambda x: [v["Id"] for v in x],
+                "value": _id_list,
             },
         ),
         (
@@ -904,6 +1090,13 @@ class DelveParser(GenericLuaParser):
         ),
     )
 
+    # (tags column, values column, weight type) - precomputed so the row loop
+    # doesn't rebuild the column names per row
+    _FOSSIL_WEIGHT_SPECS = (
+        ("NegativeWeight_TagsKeys", "NegativeWeight_Values", "override"),
+        ("Weight_TagsKeys", "Weight_Values", "added"),
+    )
+
     def main(self, parsed_args):
         delve_level_scaling = []
         delve_resources_per_level = []
@@ -913,40 +1106,45 @@ class DelveParser(GenericLuaParser):
         fossil_weights = []
 
         for row in self.rr["DelveLevelScaling.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_DELVE_LEVEL_SCALING, delve_level_scaling)
+            self._copy_append(row, self._COPY_KEYS_DELVE_LEVEL_SCALING, delve_level_scaling)
 
         for row in self.rr["DelveResourcePerLevel.dat64"]:
-            self._copy_from_keys(
+            self._copy_append(
                 row, self._COPY_KEYS_DELVE_RESOURCES_PER_LEVEL, delve_resources_per_level
             )
 
         for row in self.rr["DelveUpgrades.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_DELVE_UPGRADES, delve_upgrades)
-            delve_upgrades[-1]["cost"] = row["Cost"]
+            upgrade = self._copy_one(row, self._COPY_KEYS_DELVE_UPGRADES)
+            upgrade["cost"] = row["Cost"]
+            delve_upgrades.append(upgrade)
 
-            for i, (stat, value) in enumerate(row["Stats"]):
-                self._copy_from_keys(row, self._COPY_KEYS_DELVE_UPGRADES, delve_upgrade_stats)
-                delve_upgrade_stats[-1]["id"] = stat["Id"]
-                delve_upgrade_stats[-1]["value"] = value
+            for stat, value in row["Stats"]:
+                upgrade_stat = self._copy_one(row, self._COPY_KEYS_DELVE_UPGRADES)
+                upgrade_stat["id"] = stat["Id"]
+                upgrade_stat["value"] = value
+                delve_upgrade_stats.append(upgrade_stat)
 
+        fossil_weights_extend = fossil_weights.extend
         for row in self.rr["DelveCraftingModifiers.dat64"]:
             # Ignore all the weird RandomFossileOutcome items.
-            if "RandomFossilOutcome" in row["BaseItemTypesKey"]["Id"]:
+            base_item_id = row["BaseItemTypesKey"]["Id"]
+            if "RandomFossilOutcome" in base_item_id:
                 continue
-            self._copy_from_keys(row, self._COPY_KEYS_DELVE_CRAFTING_MODIFIERS, fossils)
-
-            for data_prefix, data_type in (
-                ("NegativeWeight", "override"),
-                ("Weight", "added"),
-            ):
-                for i, tag in enumerate(row["%s_TagsKeys" % data_prefix]):
-                    entry = OrderedDict()
-                    entry["base_item_id"] = row["BaseItemTypesKey"]["Id"]
-                    entry["type"] = data_type
-                    entry["ordinal"] = i
-                    entry["tag"] = tag["Id"]
-                    entry["weight"] = row["%s_Values" % data_prefix][i]
-                    fossil_weights.append(entry)
+            self._copy_append(row, self._COPY_KEYS_DELVE_CRAFTING_MODIFIERS, fossils)
+
+            for tags_key, values_key, data_type in self._FOSSIL_WEIGHT_SPECS:
+                tags = row[tags_key]
+                values = row[values_key]
+                fossil_weights_extend(
+                    {
+                        "base_item_id": base_item_id,
+                        "type": data_type,
+                        "ordinal": i,
+                        "tag": tag["Id"],
+                        "weight": weight,
+                    }
+                    for i, tag, weight in zip(count(), tags, values)
+                )
 
         r = ExporterResult()
         for k in (
@@ -972,31 +1170,44 @@ class DelveParser(GenericLuaParser):
 
 
 class HarvestTagHandler(TagHandler):
-    tag_handlers = {
-        "white": partial(TagHandler._basic_handler, tid="white"),
-        "craftingred": partial(TagHandler._basic_handler, tid="red"),
-        "craftingblue": partial(TagHandler._basic_handler, tid="blue"),
-        "craftinggreen": partial(TagHandler._basic_handler, tid="green"),
-        "craftingcaster": partial(TagHandler._basic_handler, tid="purple"),
-        "craftingphysical": partial(TagHandler._basic_handler, tid="tan"),
-        "craftingfire": partial(TagHandler._basic_handler, tid="orange"),
-        "craftinglightning": partial(TagHandler._basic_handler, tid="yellow"),
-        "craftingcold": partial(TagHandler._basic_handler, tid="blue"),
-        "craftingchaos": partial(TagHandler._basic_handler, tid="purple"),
-        "unique": partial(TagHandler._basic_handler, tid="orange"),
-        "magic": partial(TagHandler._basic_handler, tid="blue"),
-        "rare": partial(TagHandler._basic_handler, tid="yellow"),
-        "craftingspeed": partial(TagHandler._basic_handler, tid="green"),
-        "craftingattack": partial(TagHandler._basic_handler, tid="white"),
-        "craftinglife": partial(TagHandler._basic_handler, tid="red"),
-        "craftingcrit": partial(TagHandler._basic_handler, tid="blue"),
-        "craftingdefences": partial(TagHandler._basic_handler, tid="white"),
-        "enchanted": partial(TagHandler._basic_handler, tid="white"),
-        "fuchsia": partial(TagHandler._basic_handler, tid="magenta"),
-        "yellow": partial(TagHandler._basic_handler, tid="yellow"),
-        "aqua": partial(TagHandler._basic_handler, tid="cyan"),
+    # Every harvest tag maps onto _basic_handler with a colour id, so keep
+    # a plain str->str table and build single-layer bound-method partials
+    # in __init__ instead of stacking a partial per entry on top of the
+    # partial(func, self) wrapping done by the base class
+    tag_colors = {
+        "white": "white",
+        "craftingred": "red",
+        "craftingblue": "blue",
+        "craftinggreen": "green",
+        "craftingcaster": "purple",
+        "craftingphysical": "tan",
+        "craftingfire": "orange",
+        "craftinglightning": "yellow",
+        "craftingcold": "blue",
+        "craftingchaos": "purple",
+        "unique": "orange",
+        "magic": "blue",
+        "rare": "yellow",
+        "craftingspeed": "green",
+        "craftingattack": "white",
+        "craftinglife": "red",
+        "craftingcrit": "blue",
+        "craftingdefences": "white",
+        "enchanted": "white",
+        "fuchsia": "magenta",
+        "yellow": "yellow",
+        "aqua": "cyan",
     }
 
+    tag_handlers = {}
+
+    def __init__(self, rr):
+        super().__init__(rr=rr)
+        basic_handler = self._basic_handler
+        self.tag_handlers = {
+            name: partial(basic_handler, tid=tid) for name, tid in self.tag_colors.items()
+        }
+
 
 class HarvestParser(GenericLuaParser):
     _files = [
@@ -1042,10 +1253,11 @@ class HarvestParser(GenericLuaParser):
         harvest_craft_options = []
 
         for row in self.rr["HarvestCraftOptions.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_HARVEST_CRAFT_OPTIONS, harvest_craft_options)
-            harvest_craft_options[-1]["text"] = parse_description_tags(
-                harvest_craft_options[-1]["text"]
-            ).handle_tags(tag_handler.tag_handlers)
+            option = self._copy_one(row, self._COPY_KEYS_HARVEST_CRAFT_OPTIONS)
+            option["text"] = parse_description_tags(option["text"]).handle_tags(
+                tag_handler.tag_handlers
+            )
+            harvest_craft_options.append(option)
 
         r = ExporterResult()
         for k in ("harvest_craft_options",):
@@ -1081,35 +1293,35 @@ class HeistParser(GenericLuaParser):
             "WorldAreasKeys",
             {
                 "key": "area_ids",
-                "value": lambda v: ",".join([r["Id"] for r in v]),
+                "value": lambda v: ",".join(r["Id"] for r in v),
             },
         ),
         (
             "HeistJobsKeys",
             {
                 "key": "job_ids",
-                "value": lambda v: ",".join([r["Id"] for r in v]),
+                "value": lambda v: ",".join(r["Id"] for r in v),
             },
         ),
         (
             "Contract_BaseItemTypesKey",
             {
                 "key": "contract_id",
-                "value": lambda v: v["Id"],
+                "value": _GET_ID,
             },
         ),
         (
             "Blueprint_BaseItemTypesKey",
             {
                 "key": "blueprint_id",
-                "value": lambda v: v["Id"],
+                "value": _GET_ID,
             },
         ),
         (
             "ClientStringsKey",
             {
                 "key": "reward_text",
-                "value": lambda v: v["Text"],
+                "value": _GET_TEXT,
             },
         ),
     )
@@ -1134,7 +1346,7 @@ class HeistParser(GenericLuaParser):
             "MonsterVarietiesKey",
             {
                 "key": "id",
-                "value": lambda v: v["Id"],
+                "value": _GET_ID,
             },
         ),
         (
@@ -1147,7 +1359,7 @@ class HeistParser(GenericLuaParser):
             "HeistJobsKey",
             {
                 "key": "job_id",
-                "value": lambda v: v["Id"],
+                "value": _GET_ID,
             },
         ),
     )
@@ -1155,42 +1367,53 @@ class HeistParser(GenericLuaParser):
     def main(self, parsed_args):
         heist_areas = []
         for row in self.rr["HeistAreas.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_HEIST_AREAS, heist_areas)
+            self._copy_append(row, self._COPY_KEYS_HEIST_AREAS, heist_areas)
 
         heist_jobs = []
         for row in self.rr["HeistJobs.dat64"]:
-            self._copy_from_keys(row, self._COPY_KEYS_HEIST_JOBS, heist_jobs)
+            self._copy_append(row, self._COPY_KEYS_HEIST_JOBS, heist_jobs)
 
         heist_npcs = []
         heist_npc_skills = []
         heist_npc_stats = []
+        heist_npc_skills_append = heist_npc_skills.append
+        heist_npc_stats_append = heist_npc_stats.append
+
+        stat_descriptions = self.tc["stat_descriptions.txt"]
+
+        # NPCs share stat sets, so memoize the (comparatively expensive)
+        # translation lookup on the hashable stat/value tuples
+        @lru_cache(maxsize=None)
+        def translate(stats, values):
+            return self._format_tr(
+                stat_descriptions.get_translation(list(stats), list(values), full_result=True)
+            )
+
         for row in self.rr["HeistNPCs.dat64"]:
             mid = row["MonsterVarietiesKey"]["Id"]
-            self._copy_from_keys(row, self._COPY_KEYS_HEIST_NPCS, heist_npcs)
+            npc = self._copy_one(row, self._COPY_KEYS_HEIST_NPCS)
 
-            skills = [r["Id"] for r in row["SkillLevel_HeistJobsKeys"]]
-            for i, job_id in enumerate(skills):
-                entry = OrderedDict()
+            for job, level in zip(row["SkillLevel_HeistJobsKeys"], row["SkillLevel_Values"]):
+                entry = {}
                 entry["npc_id"] = mid
-                entry["job_id"] = job_id
-                entry["level"] = row["SkillLevel_Values"][i]
+                entry["job_id"] = job["Id"]
+                entry["level"] = level
                 # StatValues2?
-                heist_npc_skills.append(entry)
+                heist_npc_skills_append(entry)
 
             stats = [r["StatsKey"]["Id"] for r in row["HeistNPCStatsKeys"]]
-            for i, stat_id in enumerate(stats):
-                entry = OrderedDict()
+            for stat_id, value in zip(stats, row["StatValues"]):
+                entry = {}
                 entry["npc_id"] = mid
                 entry["stat_id"] = stat_id
-                entry["value"] = row["StatValues"][i]
+                entry["value"] = value
                 # StatValues2?
-                heist_npc_stats.append(entry)
+                heist_npc_stats_append(entry)
 
-            heist_npcs[-1]["stat_text"] = self._format_tr(
-                self.tc["stat_descriptions.txt"].get_translation(
-                    stats, [int(v) for v in row["StatValues"]], full_result=True
-                )
+            npc["stat_text"] = translate(
+                tuple(stats), tuple(int(v) for v in row["StatValues"])
             )
+            heist_npcs.append(npc)
 
         r = ExporterResult()
         for k in ("heist_areas", "heist_jobs", "heist_npcs", "heist_npc_skills", "heist_npc_stats"):
@@ -1234,7 +1457,7 @@ class PantheonParser(GenericLuaParser):
             "WorldAreasKey",
             {
                 "key": "target_area_id",
-                "value": lambda v: v["Id"],
+                "value": _GET_ID,
             },
         ),
         (
@@ -1262,13 +1485,23 @@ class PantheonParser(GenericLuaParser):
             "BaseItemTypesKey",
             {
                 "key": "item_id",
-                "value": lambda v: v["Id"],
+                "value": _GET_ID,
             },
         ),
     )
 
+    # The four effect slots live in numbered columns; resolve the names once
+    _EFFECT_COLUMNS = tuple(
+        (i, f"Effect{i}_Values", f"Effect{i}_StatsKeys", f"GodName{i}") for i in range(1, 5)
+    )
+
+    _INDICES = (("PantheonSouls.dat64", "PantheonPanelLayoutKey"),)
+
     def main(self, parsed_args):
-        self.rr["PantheonSouls.dat64"].build_index("PantheonPanelLayoutKey")
+        self._build_indices()
+        souls_index = self.rr["PantheonSouls.dat64"].index["PantheonPanelLayoutKey"]
+        stat_descriptions = self.tc["stat_descriptions.txt"]
+        lang = self.lang
 
         pantheon = []
         pantheon_souls = []
@@ -1278,50 +1511,45 @@ class PantheonParser(GenericLuaParser):
             if row["IsDisabled"]:
                 continue
 
-            self._copy_from_keys(row, self._COPY_KEYS_PANTHEON, pantheon)
-            for i in range(1, 5):
-                values = row["Effect%s_Values" % i]
+            self._copy_append(row, self._COPY_KEYS_PANTHEON, pantheon)
+            row_souls = None
+            for i, values_key, stats_key, god_name_key in self._EFFECT_COLUMNS:
+                values = row[values_key]
                 if not values:
                     continue
-                stats = [s["Id"] for s in row["Effect%s_StatsKeys" % i]]
-                tr = self.tc["stat_descriptions.txt"].get_translation(
-                    tags=stats, values=values, lang=self.lang, full_result=True
+                stats = [s["Id"] for s in row[stats_key]]
+                tr = stat_descriptions.get_translation(
+                    tags=stats, values=values, lang=lang, full_result=True
                 )
 
-                od = OrderedDict()
+                od = {}
                 od["id"] = row["Id"]
                 od["ordinal"] = i
-                od["name"] = row["GodName%s" % i]
+                od["name"] = row[god_name_key]
                 od["stat_text"] = self._format_tr(tr)
 
                 # The first entry is the god itself
                 if i > 1:
-                    souls = self.rr["PantheonSouls.dat64"].index["PantheonPanelLayoutKey"][row][
-                        i - 2
-                    ]
-                    od.update(self._copy_from_keys(souls, self._COPY_KEYS_PANTHEON_SOULS, rtr=True))
+                    if row_souls is None:
+                        row_souls = souls_index[row]
+                    od.update(self._copy_one(row_souls[i - 2], self._COPY_KEYS_PANTHEON_SOULS))
                 pantheon_souls.append(od)
 
                 for j, (stat, value) in enumerate(zip(stats, values), start=1):
                     pantheon_stats.append(
-                        OrderedDict(
-                            (
-                                ("pantheon_id", row["Id"]),
-                                (
-                                    "pantheon_ordinal",
-                                    i,
-                                ),
-                                ("ordinal", j),
-                                ("stat", stat),
-                                ("value", value),
-                            )
-                        )
+                        {
+                            "pantheon_id": row["Id"],
+                            "pantheon_ordinal": i,
+                            "ordinal": j,
+                            "stat": stat,
+                            "value": value,
+                        }
                     )
 
         r = ExporterResult()
-        for k in ("", "_souls", "_stats"):
+        for k, data in (("", pantheon), ("_souls", pantheon_souls), ("_stats", pantheon_stats)):
             r.add_result(
-                text=LuaFormatter.format_module(locals()["pantheon" + k]),
+                text=LuaFormatter.format_module(data),
                 out_file="pantheon%s.lua" % k,
                 wiki_page=[
                     {
@@ -1387,7 +1615,7 @@ class SynthesisParser(GenericLuaParser):
                     "ModsKey",
                     {
                         "key": "mod_id",
-                        "value": lambda v: v["Id"],
+                        "value": _GET_ID,
                     },
                 ),
                 (
@@ -1419,7 +1647,7 @@ class SynthesisParser(GenericLuaParser):
         for definition in self._DATA:
             data[definition["key"]] = []
             for row in self.rr[definition["file"]]:
-                self._copy_from_keys(row, definition["data"], data[definition["key"]])
+                self._copy_append(row, definition["data"], data[definition["key"]])
 
         r = ExporterResult()
         for definition in self._DATA:
@@ -1459,35 +1687,35 @@ class MonsterParser(GenericLuaParser):
                     "MonsterResistancesKey",
                     {
                         "key": "monster_resistance_id",
-                        "value": lambda v: v["Id"],
+                        "value": _GET_ID,
                     },
                 ),
                 (
                     "Armour",
                     {
                         "key": "armour_multiplier",
-                        "value": lambda v: v / 100,
+                        "value": _percent_multiplier,
                     },
                 ),
                 (
                     "Evasion",
                     {
                         "key": "evasion_multiplier",
-                        "value": lambda v: v / 100,
+                        "value": _percent_multiplier,
                     },
                 ),
                 (
                     "EnergyShieldFromLife",
                     {
                         "key": "energy_shield_multiplier",
-                        "value": lambda v: v / 100,
+                        "value": _percent_multiplier,
                     },
                 ),
                 (
                     "DamageSpread",
                     {
                         "key": "damage_spread",
-                        "value": lambda v: v / 100,
+                        "value": _percent_multiplier,
                     },
                 ),
             ),
@@ -1584,7 +1812,7 @@ class MonsterParser(GenericLuaParser):
                     "DisplayLevel",
                     {
                         "key": "level",
-                        "value": lambda v: int(v),
+                        "value": int,
                     },
                 ),
                 (
@@ -1719,7 +1947,7 @@ class MonsterParser(GenericLuaParser):
         for definition in self._DATA:
             data[definition["key"]] = []
             for row in self.rr[definition["file"]]:
-                self._copy_from_keys(row, definition["data"], data[definition["key"]])
+                self._copy_append(row, definition["data"], data[definition["key"]])
 
         for key, data_map in self._ENUM_DATA.items():
             map_multi = []
@@ -1814,7 +2042,7 @@ class CraftingBenchParser(GenericLuaParser):
             "ItemClasses",
             {
                 "key": "item_classes",
-                "value": lambda v: [k["Name"] for k in v],
+                "value": _name_list,
                 "default": [],
             },
         ),
@@ -1822,7 +2050,7 @@ class CraftingBenchParser(GenericLuaParser):
             "ItemClasses",
             {
                 "key": "item_classes_ids",
-                "value": lambda v: [k["Id"] for k in v],
+                "value": _id_list,
                 "default": [],
             },
         ),
@@ -1874,7 +2102,7 @@ class CraftingBenchParser(GenericLuaParser):
             "CraftingItemClassCategories",
             {
                 "key": "item_class_categories",
-                "value": lambda v: [k["Text"] for k in v],
+                "value": _text_list,
             },
         ),
         # ('CraftingBenchUnlockCategoriesKeys', {
@@ -1896,7 +2124,7 @@ class CraftingBenchParser(GenericLuaParser):
             "SortCategory",
             {
                 "key": "affix_type",
-                "value": lambda v: v["Id"],
+                "value": _GET_ID,
             },
         ),
     )
@@ -1908,19 +2136,21 @@ class CraftingBenchParser(GenericLuaParser):
             "crafting_bench_options": [],
             "crafting_bench_options_costs": [],
         }
+        options_append = data["crafting_bench_options"].append
+        costs_append = data["crafting_bench_options_costs"].append
         for row in self.rr["CraftingBenchOptions.dat64"]:
-            self._copy_from_keys(row, self._DATA, data["crafting_bench_options"])
-            data["crafting_bench_options"][-1]["id"] = row.rowid
-
-            for i, base_item in enumerate(row["Cost_BaseItemTypes"]):
-                data["crafting_bench_options_costs"].append(
-                    OrderedDict(
-                        (
-                            ("option_id", row.rowid),
-                            ("name", base_item["Name"]),
-                            ("amount", row["Cost_Values"][i]),
-                        )
-                    )
+            rowid = row.rowid
+            option = self._copy_one(row, self._DATA)
+            option["id"] = rowid
+            options_append(option)
+
+            for base_item, amount in zip(row["Cost_BaseItemTypes"], row["Cost_Values"]):
+                costs_append(
+                    {
+                        "option_id": rowid,
+                        "name": base_item["Name"],
+                        "amount": amount,
+                    }
                 )
 
         r = ExporterResult()
@@ -1956,23 +2186,30 @@ class MonsterPackParser(GenericLuaParser):
         ("BossMonsterSpawnChance", {"key": "boss_chance"}),
     )
 
+    _INDICES = (
+        ("MonsterPackEntries.dat64", "MonsterPacksKey"),
+        ("MonsterPacks.dat64", "NecropolisPack"),
+    )
+
     def main(self, parsed_args):
-        if "MonsterPacksKey" not in self.rr["MonsterPackEntries.dat64"].index:
-            self.rr["MonsterPackEntries.dat64"].build_index("MonsterPacksKey")
+        self._build_indices()
+        pack_entries_index = self.rr["MonsterPackEntries.dat64"].index["MonsterPacksKey"]
+        monster_packs_table = self.rr["MonsterPacks.dat64"]
+        corpse_type_tags = self.rr["CorpseTypeTags.dat64"]
         monsterpack_data = {}
 
         def monster(m):
             return {"monster_id": m["Id"], "name": m["Name"]}
 
-        for pack in self.rr["MonsterPacks.dat64"]:
-            data = self._copy_from_keys(pack, self._DATA, rtr=True)
+        for pack in monster_packs_table:
+            data = self._copy_one(pack, self._DATA)
             data["areas"] = [
                 {"area_id": area["Id"], "name": area["Name"], "weight": weight}
                 for area, weight in zip(pack["WorldAreasKeys"], pack["Data0"])
             ]
             data["monsters"] = [
                 monster(entry["MonsterVarietiesKey"])
-                for entry in self.rr["MonsterPackEntries.dat64"].index["MonsterPacksKey"][pack]
+                for entry in pack_entries_index[pack]
                 if entry["MonsterVarietiesKey"]
             ]
             data["boss_monsters"] = [
@@ -1980,19 +2217,30 @@ class MonsterPackParser(GenericLuaParser):
             ]
             monsterpack_data[data["id"]] = data
 
-        if "NecropolisPack" not in self.rr["MonsterPacks.dat64"].index:
-            self.rr["MonsterPacks.dat64"].build_index("NecropolisPack")
+        necro_pack_index = monster_packs_table.index["NecropolisPack"]
+
+        # One C-level regex scan per description replaces the per-pack
+        # Python loop over the whole tag table; the tag loop only runs for
+        # the (few) descriptions that actually name a corpse type
+        tag_moncats = [(tag["Name"], tag["Tag"]["Id"]) for tag in corpse_type_tags]
+        tag_re = re.compile(
+            "|".join(re.escape(name) for name, _ in sorted(tag_moncats, key=lambda t: -len(t[0])))
+        )
+
         necro_data = {}
         for pack in self.rr["NecropolisPacks.dat64"]:
             data = {"id": pack["Id"], "name": pack["Name"]}
 
             description = markup_to_wiki(pack["Description"]).splitlines()
-            for type_tag in self.rr["CorpseTypeTags.dat64"]:
-                if type_tag["Name"] in description[0]:
-                    description[0] = "{{moncat|%s}}%s" % (
-                        type_tag["Tag"]["Id"],
-                        description[0],
-                    )
+            first_line = description[0]
+            if tag_moncats and tag_re.search(first_line):
+                # Accumulate the (rare) multi-tag prefixes and prepend once
+                # instead of rebuilding the line per match
+                prefix = ""
+                for name, tag_id in tag_moncats:
+                    if name in first_line:
+                        prefix = "{{moncat|%s}}%s" % (tag_id, prefix)
+                description[0] = prefix + first_line
             data["description"] = "\n* ".join(description)
 
             if pack["PackLeader2"]:
@@ -2013,7 +2261,7 @@ class MonsterPackParser(GenericLuaParser):
             if pack["Mod"]:
                 data["mod_id"] = pack["Mod"]["Id"]
 
-            monster_packs = self.rr["MonsterPacks.dat64"].index["NecropolisPack"][pack]
+            monster_packs = necro_pack_index[pack]
             if monster_packs:
                 data["monster_pack_ids"] = [m["Id"] for m in monster_packs]
 
@@ -80,6 +80,8 @@ class GroupWikiCondition(parser.WikiCondition):
 
 
 class MasteryCommandHandler(ExporterHandler):
+    NAME = "mastery"
+
     def __init__(self, sub_parser, *args, **kwargs):
         super().__init__(self, sub_parser, *args, **kwargs)
         self.parser = sub_parser.add_parser(
@@ -78,6 +78,8 @@ class ModWikiCondition(WikiCondition):
 
 
 class ModsHandler(ExporterHandler):
+    NAME = "mods"
+
     def __init__(self, sub_parser):
         self.parser = sub_parser.add_parser("mods", help="Mods Exporter")
         self.parser.set_defaults(func=lambda args: self.parser.print_help())
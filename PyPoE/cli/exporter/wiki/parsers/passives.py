@@ -80,6 +80,8 @@ def normalize(id):
 
 
 class PassiveSkillCommandHandler(ExporterHandler):
+    NAME = "passive"
+
     def __init__(self, sub_parser):
         self.parser = sub_parser.add_parser(
             "passive",
@@ -187,19 +187,19 @@ class ConfigHandler(BaseHandler):
         configured = spec.difference(missing)
 
         console("Current stored config variables:")
-        for key in sorted(list(configured)):
+        for key in sorted(configured):
             console("%s: %s" % (key, self.config.option[key]))
 
         if missing:
             console("", raw=True)
             console("Missing config variables (require config set):", msg=Msg.error)
-            for key in sorted(list(missing)):
+            for key in sorted(missing):
                 console("%s" % (key,), Msg.error)
 
         if extra:
             console("", raw=True)
             console("Extra variables (unused):", msg=Msg.warning)
-            for key in sorted(list(extra)):
+            for key in sorted(extra):
                 console("%s: %s" % (key, self.config.option[key]), msg=Msg.warning)
 
         return 0
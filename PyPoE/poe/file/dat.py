@@ -97,6 +97,50 @@ __all__ = [
 
 DAT_FILE_MAGIC_NUMBER = b"\xBB\xbb\xBB\xbb\xBB\xbb\xBB\xbb"
 
+
+def _compile_virtual_getter(field):
+    """
+    Builds a specialized accessor for a virtual field specification so that
+    repeated :class:`DatRecord` lookups skip the per-access specification
+    dereferences and zip/alias branch tests. The compiled getters are cached
+    per reader in :attr:`DatReader._virtual_getters`.
+    """
+    fields = tuple(field["fields"])
+    do_zip = field["zip"]
+    alias = field["alias"]
+    if alias and not do_zip:
+        if len(fields) == 1:
+            field_name = fields[0]
+            return lambda record: record[field_name]
+
+        def getter(record):
+            values = [record[field_name] for field_name in fields]
+            return next((value for value in values if value is not None), None)
+
+    elif do_zip and not alias:
+
+        def getter(record):
+            return zip(*[record[field_name] for field_name in fields])
+
+    elif not do_zip and not alias:
+
+        def getter(record):
+            return [record[field_name] for field_name in fields]
+
+    else:
+
+        def getter(record):
+            return next(
+                filter(
+                    lambda value: value is not None,
+                    zip(*[record[field_name] for field_name in fields]),
+                ),
+                None,
+            )
+
+    return getter
+
+
 # =============================================================================
 # Classes
 # =============================================================================
@@ -397,14 +441,13 @@ class DatRecord(list):
                 if isinstance(value, DatValue):
                     value = value.get_value()
                 return value
+            getter = self.parent._virtual_getters.get(item)
+            if getter is not None:
+                return getter(self)
             elif item in self.parent.specification["virtual_fields"]:
-                field = self.parent.specification["virtual_fields"][item]
-                value = [self[fn] for fn in field["fields"]]
-                if field["zip"]:
-                    value = zip(*value)
-                if field["alias"]:
-                    value = next(filter(lambda v: v is not None, value), None)
-                return value
+                getter = _compile_virtual_getter(self.parent.specification["virtual_fields"][item])
+                self.parent._virtual_getters[item] = getter
+                return getter(self)
             else:
                 raise KeyError(f"No column {item} found in {self.parent.file_name}")
         return list.__getitem__(self, item)
@@ -575,6 +618,10 @@ class DatReader(ReprMixin):
             )
         self.specification = specification[_file_name]
 
+        # Specialized virtual-field accessors, built lazily on first access
+        # of each virtual field (see DatRecord.__getitem__)
+        self._virtual_getters = {}
+
         # Prepare the casts
         self.table_columns = OrderedDict()
         self.cast_size = 0
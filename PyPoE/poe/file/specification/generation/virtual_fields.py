@@ -3,6 +3,12 @@ from collections import defaultdict
 from PyPoE.poe.constants import VERSION
 from PyPoE.poe.file.specification.fields import Alias, VirtualField, Zip
 
+
+def _numbered(prefix: str, count: int, suffix: str = "") -> tuple[str, ...]:
+    """Expands numbered column names like ``Stat1Value`` .. ``Stat9Value``."""
+    return tuple(f"{prefix}{i}{suffix}" for i in range(1, count + 1))
+
+
 virtual_fields_mappings = {
     VERSION.STABLE: defaultdict(
         list[VirtualField],
@@ -28,33 +34,8 @@ virtual_fields_mappings = {
                 Zip("Stats", ("StatsKeys", "StatValues")),
             ],
             "GrantedEffectsPerLevel": [
-                VirtualField(
-                    name="StatValues",
-                    fields=(
-                        "Stat1Value",
-                        "Stat2Value",
-                        "Stat3Value",
-                        "Stat4Value",
-                        "Stat5Value",
-                        "Stat6Value",
-                        "Stat7Value",
-                        "Stat8Value",
-                        "Stat9Value",
-                    ),
-                ),
-                VirtualField(
-                    name="StatFloats",
-                    fields=(
-                        "Stat1Float",
-                        "Stat2Float",
-                        "Stat3Float",
-                        "Stat4Float",
-                        "Stat5Float",
-                        "Stat6Float",
-                        "Stat7Float",
-                        "Stat8Float",
-                    ),
-                ),
+                VirtualField(name="StatValues", fields=_numbered("Stat", 9, "Value")),
+                VirtualField(name="StatFloats", fields=_numbered("Stat", 8, "Float")),
                 Zip("Stats", ("StatsKeys", "StatValues")),
                 Zip("Costs", ("CostTypesKeys", "CostAmounts")),
             ],
@@ -80,45 +61,15 @@ virtual_fields_mappings = {
             ],
             "Mods": [
                 Zip("SpawnWeight", ("SpawnWeight_TagsKeys", "SpawnWeight_Values")),
-                VirtualField(
-                    name="Stat1Zip",
-                    fields=("StatsKey1", "Stat1Min", "Stat1Max"),
-                ),
-                VirtualField(
-                    name="Stat2Zip",
-                    fields=("StatsKey2", "Stat2Min", "Stat2Max"),
-                ),
-                VirtualField(
-                    name="Stat3Zip",
-                    fields=("StatsKey3", "Stat3Min", "Stat3Max"),
-                ),
-                VirtualField(
-                    name="Stat4Zip",
-                    fields=("StatsKey4", "Stat4Min", "Stat4Max"),
-                ),
-                VirtualField(
-                    name="Stat5Zip",
-                    fields=("StatsKey5", "Stat5Min", "Stat5Max"),
-                ),
-                VirtualField(
-                    name="Stat6Zip",
-                    fields=("StatsKey6", "Stat6Min", "Stat6Max"),
-                ),
-                VirtualField(
-                    name="StatsKeys",
-                    fields=(
-                        "StatsKey1",
-                        "StatsKey2",
-                        "StatsKey3",
-                        "StatsKey4",
-                        "StatsKey5",
-                        "StatsKey6",
-                    ),
-                ),
-                VirtualField(
-                    name="Stats",
-                    fields=("Stat1Zip", "Stat2Zip", "Stat3Zip", "Stat4Zip", "Stat5Zip", "Stat6Zip"),
+                *(
+                    VirtualField(
+                        name=f"Stat{i}Zip",
+                        fields=(f"StatsKey{i}", f"Stat{i}Min", f"Stat{i}Max"),
+                    )
+                    for i in range(1, 7)
                 ),
+                VirtualField(name="StatsKeys", fields=_numbered("StatsKey", 6)),
+                VirtualField(name="Stats", fields=_numbered("Stat", 6, "Zip")),
                 Zip("GenerationWeight", ("GenerationWeight_TagsKeys", "GenerationWeight_Values")),
             ],
             "PantheonSouls": [
@@ -128,18 +79,12 @@ virtual_fields_mappings = {
                 Alias("BossDescription", "CapturedMonsterDescription"),
             ],
             "PassiveSkills": [
-                VirtualField(
-                    name="StatValues",
-                    fields=("Stat1Value", "Stat2Value", "Stat3Value", "Stat4Value", "Stat5Value"),
-                ),
+                VirtualField(name="StatValues", fields=_numbered("Stat", 5, "Value")),
                 Zip("StatsZip", ("Stats", "StatValues")),
                 Alias("ReminderTextKeys", "ReminderStrings"),
             ],
             "PassiveSkillMasteryEffects": [
-                VirtualField(
-                    name="StatValues",
-                    fields=("Stat1Value", "Stat2Value", "Stat3Value"),
-                ),
+                VirtualField(name="StatValues", fields=_numbered("Stat", 3, "Value")),
                 Zip("StatsZip", ("Stats", "StatValues")),
             ],
             "PassiveSkillOverrides": [
@@ -29,7 +29,6 @@ See PyPoE/LICENSE
 
 .. todo::
 
-    optimize __hash__ very slow atm; or remove, but it is needed for the diffs
     reverse for non-number values?
 
     Fix empty translation strings
@@ -113,18 +112,21 @@ Warning Classes
 # =============================================================================
 
 # Python
+import hashlib
 import io
 import os
+import pickle
 import re
+import sys
 import warnings
-from collections import OrderedDict, defaultdict
+from collections import Counter, OrderedDict, defaultdict
 from collections.abc import Iterable
 from enum import IntEnum
 from string import ascii_letters
 from typing import Any, Callable, Dict, List, Literal, Tuple, TypeVar, Union, overload
 
 # self
-from PyPoE import DATA_DIR
+from PyPoE import APP_DIR, DATA_DIR
 from PyPoE.poe.constants import MOD_GENERATION_TYPE
 from PyPoE.poe.file.dat import DatRecord, RelationalReader
 from PyPoE.poe.file.shared import AbstractFileReadOnly, ParserError, ParserWarning
@@ -151,6 +153,16 @@ __all__ = [
 CUSTOM_TRANSLATION_FILE = os.path.join(DATA_DIR, "custom_descriptions.txt")
 HARDCODED_TRANSLATION_FILE = os.path.join(DATA_DIR, "hardcoded_descriptions.txt")
 
+# Overridable so tests (and parallel jobs) can isolate their cache from the
+# user's real application directory
+TRANSLATION_CACHE_DIR = os.environ.get(
+    "PYPOE_TRANSLATION_CACHE_DIR", os.path.join(APP_DIR, "translation_cache")
+)
+
+# Bump when the parsed representation changes so stale cache entries from
+# older versions of the parser are ignored
+_TRANSLATION_CACHE_VERSION = 3
+
 regex_translation_string = re.compile(
     r"^"
     r"\s*"
@@ -163,20 +175,122 @@ regex_translation_string = re.compile(
     re.UNICODE | re.MULTILINE,
 )
 
-regex_ids = re.compile(r"\S+.*(?!\s[0-9]+)", re.UNICODE | re.MULTILINE)
-regex_id_strings = re.compile(r"([\S]+)", re.UNICODE)
-regex_strings = re.compile(r'(?:"(.+)")|([\S]+)+', re.UNICODE)
-regex_int = re.compile(r"[0-9]+", re.UNICODE)
-regex_isnumber = re.compile(r"^[0-9\-]+$", re.UNICODE)
+regex_ids = re.compile(r"\S+.*(?!\s[0-9]+)", re.MULTILINE)
+regex_id_strings = re.compile(r"([\S]+)")
+regex_strings = re.compile(r'(?:"(.+)")|(\S+)', re.UNICODE)
+# Only ever sees ASCII digit tokens
+regex_int = re.compile(r"[0-9]+", re.ASCII)
 regex_lang = re.compile(r'^[\s]*lang "(?P<language>[\w ]+)"[\s]*$', re.UNICODE | re.MULTILINE)
+# The quoted groups use [^"\n]* rather than .* so the engine never has to
+# backtrack from the end of the line to find the closing quote
 regex_tokens = re.compile(
-    r'(?:^"(?P<header>.*)"$)'
-    r'|(?:^include "(?P<include>.*)")'
+    r'(?:^"(?P<header>[^"\n]*)"$)'
+    r'|(?:^include "(?P<include>[^"\n]*)")'
     r"|(?:^no_description[\s]*(?P<no_description>[\w+%]*)[\s]*$)"
     r"|(?P<description>^description[\s]*(?P<identifier>[\S]*)[\s]*$)",
     re.UNICODE | re.MULTILINE,
 )
 
+_MINMAX_CHARS = "0123456789-|#!"
+
+# Anchored single-token equivalents of the groups in
+# regex_translation_string, used by the fast path below
+_re_word_token = re.compile(r"\w+\Z")
+_re_quantifier_token = re.compile(r"[\w%]+\Z")
+
+
+def _match_translation_string(data, offset, endpos):
+    """
+    Fast path for the common, well-formed ``minmax... "description"
+    quantifier...`` entry that makes up nearly every line of a description
+    file. Avoids the backtracking regex engine in favour of a couple of
+    ``str.find``/``str.split`` calls.
+
+    Returns a tuple mirroring :data:`regex_translation_string` results -
+    ``(end, minmax, restriction, description, quantifier, minmax_offset)`` -
+    or None if the entry is not trivially well-formed, in which case the
+    caller must fall back to the regex.
+    """
+    quote_start = data.find('"', offset, endpos)
+    if quote_start < 0:
+        return None
+    quote_end = data.find('"', quote_start + 1, endpos)
+    if quote_end < 0:
+        return None
+
+    head = data[offset:quote_start]
+    if not head or head[-1] not in " \t":
+        # Each minmax/restriction token must be followed by a space or tab
+        return None
+    stripped = head.lstrip()
+    if not stripped:
+        return None
+    # The regex anchors the entry at a line start; only accept when one lies
+    # between offset and the first token
+    if "\n" not in head[: len(head) - len(stripped)] and not (
+        offset == 0 or data[offset - 1] == "\n"
+    ):
+        return None
+    for c in stripped:
+        if c.isspace() and c not in " \t":
+            # Newlines or exotic whitespace between tokens - regex territory
+            return None
+
+    tokens = stripped.split()
+    n_minmax = 0
+    for tok in tokens:
+        if tok.strip(_MINMAX_CHARS):
+            break
+        n_minmax += 1
+    if n_minmax == 0:
+        return None
+    for tok in tokens[n_minmax:]:
+        if not _re_word_token.match(tok):
+            return None
+
+    # Quantifier tokens sit on the same line as the closing quote
+    pos = quote_end + 1
+    line_end = data.find("\n", pos, endpos)
+    if line_end < 0:
+        line_end = endpos
+    tail = data[pos:line_end]
+    run_start = line_end
+    if tail.endswith("\r"):
+        tail = tail[:-1]
+        run_start -= 1
+    quantifier = tail.rstrip(" \t")
+    if quantifier:
+        for c in quantifier:
+            if c.isspace() and c not in " \t":
+                return None
+        for tok in quantifier.split():
+            if not _re_quantifier_token.match(tok):
+                return None
+
+    # The regex consumes trailing whitespace and - when further content
+    # follows - every newline of the run except the last one
+    j = run_start
+    while j < endpos and data[j] in "\r\n":
+        j += 1
+    if j >= endpos:
+        end = j
+    else:
+        end = j - 1
+        while end >= run_start and data[end] != "\n":
+            end -= 1
+        if end < run_start:
+            return None
+
+    return (
+        end,
+        " ".join(tokens[:n_minmax]),
+        " ".join(tokens[n_minmax:]),
+        data[quote_start + 1 : quote_end],
+        quantifier,
+        offset + (len(head) - len(stripped)),
+    )
+
+
 _custom_translation_file = None
 _hardcoded_translation_file = None
 
@@ -241,21 +355,31 @@ class Translation(TranslationReprMixin):
         Index within the translation file
     """
 
-    __slots__ = ["languages", "ids", "identifier", "tf_index"]
+    __slots__ = ["languages", "languages_by_name", "ids", "identifier", "tf_index", "_hash"]
 
     _REPR_EXTRA_ATTRIBUTES = OrderedDict((("ids", None),))
 
     def __init__(self, identifier: Union[str, None], tf_index: int, parent: "TranslationFile"):
         self.languages: List[TranslationLanguage] = []
+        self.languages_by_name: Dict[str, TranslationLanguage] = {}
         self.ids: List[str] = []
         self.identifier: Union[str, None] = identifier
         self.tf_index: Union[int, None] = tf_index
         self.parent = parent
+        self._hash: Union[int, None] = None
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Translation):
             return False
 
+        # Cached hashes reject distinct translations without comparing the
+        # underlying lists; equal hashes still verify field by field
+        if hash(self) != hash(other):
+            return False
+
         if self.ids != other.ids:
             return False
 
@@ -268,7 +392,25 @@ class Translation(TranslationReprMixin):
         return True
 
     def __hash__(self):
-        return hash((tuple(self.languages), tuple(self.ids)))
+        # Hashing the ids is sufficient for consistency with __eq__ and
+        # avoids walking the whole language/string tree; cache the result
+        # since translations are hashed repeatedly when diffing via sets
+        try:
+            result = self._hash
+        except AttributeError:
+            result = None
+        if result is None:
+            result = hash((self.identifier, tuple(self.ids)))
+            self._hash = result
+        return result
+
+    def __getstate__(self):
+        dict_state, slots_state = object.__getstate__(self)
+        if slots_state:
+            # str hashes are randomized per process, so a cached value must
+            # never cross process boundaries via the disk cache
+            slots_state.pop("_hash", None)
+        return dict_state, slots_state
 
     def diff(self, other):
         if not isinstance(other, Translation):
@@ -299,14 +441,11 @@ class Translation(TranslationReprMixin):
             Returns the :class:`TranslationLanguage` record for the specified
             language or the English one if not found
         """
-        etr = None
-        for tr in self.languages:
-            if tr.language == language:
-                return tr
-            elif tr.language == "English":
-                etr = tr
-
-        return etr
+        by_name = self.languages_by_name
+        tr = by_name.get(language)
+        if tr is None and language != "English":
+            tr = by_name.get("English")
+        return tr
 
 
 class TranslationLanguage(TranslationReprMixin):
@@ -328,6 +467,8 @@ class TranslationLanguage(TranslationReprMixin):
 
     def __init__(self, language: str, parent: Translation):
         parent.languages.append(self)
+        # First language registered for a name wins, like the old list scan
+        parent.languages_by_name.setdefault(language, self)
         self.parent = parent
         self.language = language
         self.strings: List[TranslationString] = []
@@ -396,21 +537,22 @@ class TranslationLanguage(TranslationReprMixin):
                 short_values.append(item)
                 is_range.append(False)
 
-        temp = []
-        for ts in self.strings:
+        # Only the highest scoring/matching translation; first one wins ties
+        rating = 0
+        ts = None
+        for candidate in self.strings:
             # TODO: check whether this really is a non issue now
             # if len(values) != len(ts.range):
             #   raise Exception('mismatch %s' % ts.range)
 
-            if ts.restrictions:
+            if candidate.restrictions:
                 # only known restriction is 'table_only' which is not currently needed
                 continue
 
-            match = ts.match_range(test_values)
-            temp.append((match, ts))
-
-        # Only the highest scoring/matching translation...
-        rating, ts = max(temp, key=lambda x: x[0], default=(0, None))
+            match = candidate.match_range(test_values)
+            if ts is None or match > rating:
+                rating = match
+                ts = candidate
 
         if rating <= 0:
             return None, None, None
@@ -847,15 +989,38 @@ class TranslationRange(TranslationReprMixin):
         Whether the value is negated
     """
 
-    __slots__ = ["parent", "min", "max", "negated"]
+    __slots__ = ["min", "max", "negated"]
+
+    # Ranges are interned flyweights shared across translation strings, so
+    # there is no meaningful parent; keep the attribute readable for repr
+    parent = None
+
+    # Maps (min, max, negated) to the shared instance; stat files reuse the
+    # same few dozen range combinations across thousands of strings
+    _pool: Dict[Tuple, "TranslationRange"] = {}
 
-    def __init__(self, min: int, max: int, parent: TranslationString, negated: bool = False):
-        parent.range.append(self)
-        self.parent: TranslationString = parent
+    def __init__(self, min: int, max: int, parent: TranslationString = None, negated: bool = False):
+        if parent is not None:
+            parent.range.append(self)
         self.min: int = min
         self.max: int = max
         self.negated: bool = negated
 
+    @classmethod
+    def create(
+        cls, min: int, max: int, parent: TranslationString, negated: bool = False
+    ) -> "TranslationRange":
+        """
+        Appends the pooled range instance for the given bounds to the parent
+        :class:`TranslationString`, creating it on first use.
+        """
+        key = (min, max, negated)
+        instance = cls._pool.get(key)
+        if instance is None:
+            instance = cls._pool[key] = cls(min, max, negated=negated)
+        parent.range.append(instance)
+        return instance
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, TranslationRange):
             return False
@@ -894,35 +1059,32 @@ class TranslationRange(TranslationReprMixin):
             2 if either minimum or maximum is specified
             3 if both minimum and maximum is specified
         """
-        # Any range is accepted
-        if self.min is None and self.max is None:
-            return 1
+        # This runs for every range of every candidate string during
+        # get_string, so keep it flat: no closures, just inline comparisons
+        # (negation flips each bound check and turns the "between" test into
+        # an "outside" test).
+        minimum = self.min
+        maximum = self.max
+
+        if minimum is None:
+            # Any range is accepted
+            if maximum is None:
+                return 1
+            if value > maximum if self.negated else value <= maximum:
+                return 2
+            return -10000
 
-        def f_comp(left, right):
-            return left > right if self.negated else left <= right
+        if maximum is None:
+            if minimum > value if self.negated else minimum <= value:
+                return 2
+            return -10000
 
         if self.negated:
-            f_and = bool.__or__
-        else:
-            f_and = bool.__and__
-
-        if self.min is None:
-            if f_comp(value, self.max):
-                return 2
-            else:
-                return -10000
-        elif self.max is None:
-            if f_comp(self.min, value):
-                return 2
-            else:
-                return -10000
-        elif self.min is not None and self.max is not None:
-            if f_and(f_comp(self.min, value), f_comp(value, self.max)):
+            if minimum > value or value > maximum:
                 return 3
-            else:
-                return -10000
-
-        return -100
+        elif minimum <= value <= maximum:
+            return 3
+        return -10000
 
 
 class TranslationQuantifierHandler(TranslationReprMixin):
@@ -1033,15 +1195,19 @@ class TranslationQuantifierHandler(TranslationReprMixin):
         string
             quantifier string
         """
-        values = iter(self.regex.split(string))
+        parts = self.regex.split(string)
 
-        for partial in values:
-            partial = partial.strip()
+        i = 0
+        end = len(parts)
+        while i < end:
+            partial = parts[i].strip()
+            i += 1
             if partial == "":
                 continue
             handler = self.handlers.get(partial)
             if handler:
-                args = [values.__next__() for i in range(0, handler.arg_size)]
+                args = parts[i : i + handler.arg_size]
+                i += handler.arg_size
                 if handler.type == TranslationQuantifier.QuantifierTypes.INT:
                     try:
                         self.index_handlers[handler.id].append(int(args[0]))
@@ -1080,26 +1246,35 @@ class TranslationQuantifierHandler(TranslationReprMixin):
 
             The format strings for each value
         """
-        values = list(values)
         formats = [noop_quantifier for r in is_range]
-        for handler_name in self.index_handlers:
-            f = self._get_handler_func(handler_name)
-            if f is None:
-                continue
-            for index in self.index_handlers[handler_name]:
-                index -= 1
-                if is_range[index]:
-                    values[index] = (f.handler(values[index][0]), f.handler(values[index][1]))
-                    formats[index] = f
-                else:
-                    values[index] = f.handler(values[index])
-                    formats[index] = f
+        whole_float_to_int = self._whole_float_to_int
+        if self.index_handlers:
+            values = list(values)
+            for handler_name, indexes in self.index_handlers.items():
+                f = self._get_handler_func(handler_name)
+                if f is None:
+                    continue
+                for index in indexes:
+                    index -= 1
+                    if is_range[index]:
+                        values[index] = (f.handler(values[index][0]), f.handler(values[index][1]))
+                        formats[index] = f
+                    else:
+                        values[index] = f.handler(values[index])
+                        formats[index] = f
 
-        for i, value in enumerate(values):
-            if is_range[i]:
-                values[i] = tuple([self._whole_float_to_int(v) for v in value])
-            else:
-                values[i] = self._whole_float_to_int(value)
+            for i, value in enumerate(values):
+                if is_range[i]:
+                    values[i] = tuple([whole_float_to_int(v) for v in value])
+                else:
+                    values[i] = whole_float_to_int(value)
+        else:
+            # Common case: no value quantifiers registered, so build the
+            # normalized list in a single pass instead of copy-then-convert
+            values = [
+                tuple([whole_float_to_int(v) for v in value]) if r else whole_float_to_int(value)
+                for value, r in zip(values, is_range)
+            ]
 
         strings = OrderedDict()
         for handler_name, args in self.string_handlers.items():
@@ -1124,13 +1299,13 @@ class TranslationQuantifierHandler(TranslationReprMixin):
             handled list of values
         """
         indexes = set(range(0, len(values)))
-        for handler_name in self.index_handlers:
+        for handler_name, handler_indexes in self.index_handlers.items():
             try:
                 f = self.reverse_handlers[handler_name].reverse_handler
             except KeyError:
                 self._warn_uncaptured(handler_name)
                 break
-            for index in self.index_handlers[handler_name]:
+            for index in handler_indexes:
                 index -= 1
                 indexes.remove(index)
                 # TODO: handle string values
@@ -1496,7 +1671,7 @@ class TranslationFile(AbstractFileReadOnly):
         is only one.
     """
 
-    __slots__ = ["translations", "translations_hash", "_base_dir", "_parent"]
+    __slots__ = ["translations", "translations_hash", "_base_dir", "_parent", "_merged_includes"]
 
     _VIRTUAL_STAT_LOOKUP = {
         "corrosive_shroud_maximum_stored_poison_damage": "virtual_plague_bearer_maximum_stored_poison_damage"
@@ -1555,6 +1730,7 @@ class TranslationFile(AbstractFileReadOnly):
         self.translations: List[Translation] = []
         self.translations_hash: Dict[str, list[Translation]] = {}
         self._base_dir: str = base_dir
+        self._merged_includes: bool = False
 
         if parent is not None:
             if not isinstance(parent, TranslationFileCache):
@@ -1571,9 +1747,104 @@ class TranslationFile(AbstractFileReadOnly):
             for path in file_path:
                 self.merge(TranslationFile(path))
 
+    def __getstate__(self):
+        # Only the parsed result goes into the disk cache; the parent cache
+        # (and everything it references) must not be serialized with it
+        return {
+            "translations": self.translations,
+            "translations_hash": self.translations_hash,
+        }
+
+    def __setstate__(self, state):
+        self.translations = state["translations"]
+        self.translations_hash = state["translations_hash"]
+        self._base_dir = None
+        self._parent = None
+        self._merged_includes = False
+
+    @staticmethod
+    def _disk_cache_path(file_path: str) -> Union[str, None]:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        key = hashlib.blake2b(
+            b"%d\x00%d\x00%d\x00%s"
+            % (
+                _TRANSLATION_CACHE_VERSION,
+                st.st_mtime_ns,
+                st.st_size,
+                os.path.abspath(file_path).encode("utf-8", errors="surrogateescape"),
+            ),
+            digest_size=16,
+        ).hexdigest()
+        return os.path.join(TRANSLATION_CACHE_DIR, key + ".pickle")
+
+    @staticmethod
+    def _disk_cache_path_for_data(raw: bytes) -> str:
+        # Raw bytes (as handed over by FileSystem.get_file) carry no mtime,
+        # so key the cache by content instead
+        key = hashlib.blake2b(
+            b"%d\x00" % _TRANSLATION_CACHE_VERSION + raw,
+            digest_size=16,
+        ).hexdigest()
+        return os.path.join(TRANSLATION_CACHE_DIR, key + ".pickle")
+
+    def _load_disk_cache(self, cache_path: str) -> bool:
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+        except OSError:
+            return False
+        except Exception:
+            # A broken or stale entry is no worse than a cache miss
+            return False
+        self.translations = cached.translations
+        self.translations_hash = cached.translations_hash
+        return True
+
+    def _write_disk_cache(self, cache_path: str):
+        if self._merged_includes:
+            # The cache key only covers this file, so results that pulled in
+            # other files would go stale when those files change
+            return
+        try:
+            os.makedirs(TRANSLATION_CACHE_DIR, exist_ok=True)
+            tmp_path = "%s.%s.tmp" % (cache_path, os.getpid())
+            with open(tmp_path, "wb") as f:
+                pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    def read(self, file_path_or_raw: Union[io.BytesIO, bytes, str], *args, **kwargs) -> Any:
+        """
+        Reads the translation file, using a cached pre-parsed copy from
+        :data:`TRANSLATION_CACHE_DIR` when one exists. Path reads are keyed
+        by the file's current mtime and size, raw bytes (the
+        :class:`FileSystem` path) by a hash of their content; after a regular
+        parse the result is written back under the same key.
+
+        Also see :meth:`AbstractFileReadOnly.read`.
+        """
+        if isinstance(file_path_or_raw, str):
+            cache_path = self._disk_cache_path(file_path_or_raw)
+        elif isinstance(file_path_or_raw, bytes):
+            cache_path = self._disk_cache_path_for_data(file_path_or_raw)
+        else:
+            cache_path = None
+        if cache_path is not None:
+            if self._load_disk_cache(cache_path):
+                return
+            result = super().read(file_path_or_raw, *args, **kwargs)
+            self._write_disk_cache(cache_path)
+            return result
+        return super().read(file_path_or_raw, *args, **kwargs)
+
     def _read(self, buffer, *args, **kwargs):
         translation_index = 0
         self.translations = []
+        self._merged_includes = False
         data = buffer.read().decode("utf-16")
 
         # starts with bom?
@@ -1603,8 +1874,11 @@ class TranslationFile(AbstractFileReadOnly):
                         "Couldn't find id count between offset %s and %s" % (offset, offset_max)
                     )
 
-                # Actually extract the individual ids
-                translation.ids = regex_id_strings.findall(id_string.group(0))
+                # Actually extract the individual ids. The same stat ids
+                # recur across description files, so intern them
+                translation.ids = [
+                    sys.intern(tid) for tid in regex_id_strings.findall(id_string.group(0))
+                ]
 
                 if len(translation.ids) != id_count:
                     print(data[offset:offset_max])
@@ -1629,32 +1903,48 @@ class TranslationFile(AbstractFileReadOnly):
                         t = False
                     else:
                         offset_next_lang = language_match.start()
-                        language = language_match.group("language")
+                        # The same few language names repeat per translation
+                        language = sys.intern(language_match.group("language"))
 
                     for i in range(0, int(tcount.group())):
-                        ts_match = regex_translation_string.search(data, offset, offset_next_lang)
-                        if not ts_match:
-                            context = 20
-                            line_number = data.count("\n", 0, offset)
-                            before = data[max(offset - context, 0) : offset]
-                            match = data[offset : offset_next_lang + 1]
-                            after = data[
-                                offset_next_lang + 1 : min(offset_next_lang + context, offset_max)
-                            ]
-                            raise ParserError(
-                                f"Malformed translation string near line {line_number}"
-                                f" @ ids {translation.ids}: ‘...{before}[{match}]{after}...’"
+                        parsed = _match_translation_string(data, offset, offset_next_lang)
+                        if parsed is None:
+                            ts_match = regex_translation_string.search(
+                                data, offset, offset_next_lang
+                            )
+                            if not ts_match:
+                                context = 20
+                                line_number = data.count("\n", 0, offset)
+                                before = data[max(offset - context, 0) : offset]
+                                match = data[offset : offset_next_lang + 1]
+                                after = data[
+                                    offset_next_lang
+                                    + 1 : min(offset_next_lang + context, offset_max)
+                                ]
+                                raise ParserError(
+                                    f"Malformed translation string near line {line_number}"
+                                    f" @ ids {translation.ids}: ‘...{before}[{match}]{after}...’"
+                                )
+                            parsed = (
+                                ts_match.end(),
+                                ts_match.group("minmax"),
+                                ts_match.group("restriction"),
+                                ts_match.group("description"),
+                                ts_match.group("quantifier"),
+                                ts_match.start("minmax"),
                             )
 
-                        offset = ts_match.end()
+                        offset, s_minmax, s_restriction, s_description, s_quantifier, minmax_pos = (
+                            parsed
+                        )
 
                         ts = TranslationString(parent=tl)
 
-                        if ts_match.group("restriction"):
-                            ts.restrictions = ts_match.group("restriction").strip().split()
+                        if s_restriction:
+                            ts.restrictions = s_restriction.strip().split()
 
                         # Min/Max limiter
-                        limiter = ts_match.group("minmax").strip().split()
+                        limiter = s_minmax.strip().split()
                         for j in range(0, id_count):
                             matchstr = limiter[j]
                             if matchstr.startswith("!"):
@@ -1664,32 +1954,29 @@ class TranslationFile(AbstractFileReadOnly):
                                 negated = False
 
                             if matchstr == "#":
-                                TranslationRange(None, None, parent=ts, negated=negated)
-                            elif regex_isnumber.match(matchstr):
+                                TranslationRange.create(None, None, parent=ts, negated=negated)
+                            elif not matchstr.strip("0123456789-"):
                                 value = int(matchstr)
-                                TranslationRange(value, value, parent=ts, negated=negated)
+                                TranslationRange.create(value, value, parent=ts, negated=negated)
                             elif "|" in matchstr:
                                 minmax = matchstr.split("|")
                                 min_val = int(minmax[0]) if minmax[0] != "#" else None
                                 max_val = int(minmax[1]) if minmax[1] != "#" else None
-                                TranslationRange(min_val, max_val, parent=ts, negated=negated)
+                                TranslationRange.create(min_val, max_val, parent=ts, negated=negated)
                             else:
-                                TranslationRange(None, None, parent=ts, negated=negated)
+                                TranslationRange.create(None, None, parent=ts, negated=negated)
                                 warnings.warn(
                                     'Malformed quantifier string "%s" near index %s (parent %s).'
-                                    " Assuming # instead."
-                                    % (matchstr, ts_match.start("minmax"), translation.ids),
+                                    " Assuming # instead." % (matchstr, minmax_pos, translation.ids),
                                     TranslationWarning,
                                 )
 
                         # assuming that line breaks within the description are just for dev legibility,
                         # as they seem to be preceded by escaped newlines (literal \n) anyway
-                        ts._set_string(
-                            "".join(s.strip() for s in ts_match.group("description").splitlines())
-                        )
+                        ts._set_string("".join(s.strip() for s in s_description.splitlines()))
 
                         ts.quantifier.register_from_string(
-                            ts_match.group("quantifier"),
+                            s_quantifier,
                         )
 
                     offset = offset_next_lang
@@ -1709,11 +1996,13 @@ class TranslationFile(AbstractFileReadOnly):
                     include_file = match.group("include").replace("\\", "/")
                     other_tf = self._parent.get_file(include_file)
                     self.merge(other_tf)
+                    self._merged_includes = True
                     translation_index += len(other_tf.translations)
                 elif self._base_dir:
                     real_path = os.path.join(self._base_dir, match.group("include"))
                     other_tf = TranslationFile(real_path, base_dir=self._base_dir)
                     self.merge(other_tf)
+                    self._merged_includes = True
                     translation_index += len(other_tf.translations)
                 else:
                     warnings.warn(
@@ -1745,31 +2034,34 @@ class TranslationFile(AbstractFileReadOnly):
                 pass
 
     def _add_translation_hashed(self, translation_id, translation):
-        if translation_id in self.translations_hash:
-            for old_translation in self.translations_hash[translation_id]:
-                # Identical, ignore
-                if translation == old_translation:
-                    return
-
-                # Identical ids, but more recent - update
-                if translation.ids == old_translation.ids:
-                    self.translations_hash[translation_id] = [translation]
-                    # Attempt to remove the old one if it exists
-                    try:
-                        self.translations.remove(old_translation)
-                    except ValueError:
-                        pass
-
-                    return
-
-                """print('Diff for id: %s' % translation_id)
-                translation.diff(other)
-                print('')"""
-
-                warnings.warn(f'Duplicate id "{translation_id}"', DuplicateIdentifierWarning)
-                self.translations_hash[translation_id].append(translation)
-        else:
-            self.translations_hash[translation_id] = [translation]
+        # Interned keys make the repeated lookups against this dict pointer
+        # comparisons; setdefault keeps this to a single hash probe
+        bucket = self.translations_hash.setdefault(sys.intern(translation_id), [])
+        if not bucket:
+            bucket.append(translation)
+            return
+        for old_translation in bucket:
+            # Identical, ignore
+            if translation == old_translation:
+                return
+
+            # Identical ids, but more recent - update
+            if translation.ids == old_translation.ids:
+                self.translations_hash[translation_id] = [translation]
+                # Attempt to remove the old one if it exists
+                try:
+                    self.translations.remove(old_translation)
+                except ValueError:
+                    pass
+
+                return
+
+            """print('Diff for id: %s' % translation_id)
+            translation.diff(other)
+            print('')"""
+
+            warnings.warn(f'Duplicate id "{translation_id}"', DuplicateIdentifierWarning)
+            bucket.append(translation)
 
     def copy(self):
         """
@@ -1910,6 +2202,7 @@ class TranslationFile(AbstractFileReadOnly):
                 values[v] = values[k]
 
         trans_found: List[Translation] = []
+        trans_found_set: set[Translation] = set()
         trans_missing = []
         trans_missing_values = []
         trans_found_values = []
@@ -1934,8 +2227,8 @@ class TranslationFile(AbstractFileReadOnly):
 
             # tr = self.translations_hash[tag][-1]
             for tr in self.translations_hash[tag]:
-                tr.ids.index(tag)
-                if tr not in trans_found:
+                if tr not in trans_found_set:
+                    trans_found_set.add(tr)
                     trans_found.append(tr)
                     v = [values.get(id) for id in tr.ids]
                     trans_found_values.append(v)
@@ -2188,10 +2481,11 @@ def _diff_list(self, other, diff=True):
     if len_self != len_other:
         print("Different length, %s vs %s" % (len_self, len_other))
 
-        set_self = set(self)
-        set_other = set(other)
-        print("Extra items in self: %s" % set_self.difference(set_other))
-        print("Extra item in other: %s" % set_other.difference(set_self))
+        # Counter subtraction keeps multiplicity, unlike a plain set diff
+        counter_self = Counter(self)
+        counter_other = Counter(other)
+        print("Extra items in self: %s" % list((counter_self - counter_other).elements()))
+        print("Extra item in other: %s" % list((counter_other - counter_self).elements()))
         return
 
     if diff:
@@ -2200,11 +2494,9 @@ def _diff_list(self, other, diff=True):
 
 
 def _diff_dict(self, other):
-    key_self = set(tuple(self.keys()))
-    key_other = set(tuple(other.keys()))
-
-    kdiff_self = key_self.difference(key_other)
-    kdiff_other = key_other.difference(key_self)
+    # dict views support set algebra natively, no materialization needed
+    kdiff_self = self.keys() - other.keys()
+    kdiff_other = other.keys() - self.keys()
 
     if kdiff_self:
         print("Extra keys in self:")
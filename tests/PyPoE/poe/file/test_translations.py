@@ -145,6 +145,89 @@ class TestTranslationFileCache:
         assert tcache["descriptions_extended.txt"] is a, "Cache should return identical object"
 
 
+class TestTranslationDiskCache:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        # Isolate from the session-wide cache directory so entry counts are
+        # deterministic per test
+        cache_dir = str(tmp_path / "translation_cache")
+        monkeypatch.setattr(translations, "TRANSLATION_CACHE_DIR", cache_dir)
+        return cache_dir
+
+    @pytest.fixture
+    def source_path(self, tmp_path):
+        # A private copy of the base descriptions so tests can modify it
+        with open(dbase_path, "rb") as f:
+            raw = f.read()
+        path = str(tmp_path / "descriptions.txt")
+        with open(path, "wb") as f:
+            f.write(raw)
+        return path
+
+    @staticmethod
+    def _cache_entries(cache_dir):
+        if not os.path.isdir(cache_dir):
+            return []
+        return [file_name for file_name in os.listdir(cache_dir) if file_name.endswith(".pickle")]
+
+    @staticmethod
+    def _forbid_parse(monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("Parser ran despite a warm cache")
+
+        monkeypatch.setattr(translations.TranslationFile, "_read", fail)
+
+    def test_path_read_miss_then_hit(self, cache_dir, source_path, monkeypatch):
+        tf = translations.TranslationFile()
+        tf.read(source_path)
+        assert len(self._cache_entries(cache_dir)) == 1, "Miss should write one entry"
+
+        self._forbid_parse(monkeypatch)
+        tf2 = translations.TranslationFile()
+        tf2.read(source_path)
+        assert tf2 == tf, "Cached result should match the parsed one"
+
+    def test_bytes_read_miss_then_hit(self, cache_dir, monkeypatch):
+        with open(dbase_path, "rb") as f:
+            raw = f.read()
+
+        tf = translations.TranslationFile()
+        tf.read(raw)
+        assert len(self._cache_entries(cache_dir)) == 1, "Miss should write one entry"
+
+        self._forbid_parse(monkeypatch)
+        tf2 = translations.TranslationFile()
+        tf2.read(raw)
+        assert tf2 == tf, "Cached result should match the parsed one"
+
+    def test_invalidation_on_file_change(self, cache_dir, source_path):
+        translations.TranslationFile().read(source_path)
+
+        with open(source_path, "rb") as f:
+            data = f.read().decode("utf-16")
+        # The replacement also changes the file size; mtime alone is not a
+        # reliable discriminator on filesystems with coarse timestamps
+        with open(source_path, "wb") as f:
+            f.write(data.replace("tag_size1_uq2_no1", "tag_size1_uq2_renamed").encode("utf-16"))
+
+        tf = translations.TranslationFile()
+        tf.read(source_path)
+        assert "tag_size1_uq2_renamed" in tf.translations_hash, "Change should be reparsed"
+        assert len(self._cache_entries(cache_dir)) == 2, "Changed file should get a new entry"
+
+    def test_invalidation_on_version_bump(self, cache_dir, source_path, monkeypatch):
+        translations.TranslationFile().read(source_path)
+        assert len(self._cache_entries(cache_dir)) == 1
+
+        monkeypatch.setattr(
+            translations,
+            "_TRANSLATION_CACHE_VERSION",
+            translations._TRANSLATION_CACHE_VERSION + 1,
+        )
+        translations.TranslationFile().read(source_path)
+        assert len(self._cache_entries(cache_dir)) == 2, "Version bump should miss the old entry"
+
+
 class TestTranslationResults:
     #
     # Data for this section
@@ -40,7 +40,7 @@ from PyPoE.cli.exporter.core import setup_config
 
 # self
 from PyPoE.poe.constants import DISTRIBUTOR, VERSION
-from PyPoE.poe.file import dat
+from PyPoE.poe.file import dat, translations
 from PyPoE.poe.file.file_system import FileSystem
 from PyPoE.poe.file.specification import load
 from PyPoE.poe.path import PoEPath
@@ -114,6 +114,17 @@ def pytest_generate_tests(metafunc):
 # =============================================================================
 
 
+@pytest.fixture(scope="session", autouse=True)
+def translation_cache_dir(tmp_path_factory) -> str:
+    """
+    Redirects the translation disk cache into a per-session temporary
+    directory so test runs neither read stale entries from nor write
+    pickles into the user's real application directory.
+    """
+    translations.TRANSLATION_CACHE_DIR = str(tmp_path_factory.mktemp("translation_cache"))
+    return translations.TRANSLATION_CACHE_DIR
+
+
 @pytest.fixture(scope="session")
 def poe_version(request) -> VERSION:
     v = get_version(request.config)